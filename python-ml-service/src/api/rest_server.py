@@ -13,6 +13,7 @@ import json
 from datetime import datetime
 
 from ..utils.logger import get_logger
+from ..models.metrics import to_json
 
 logger = get_logger(__name__)
 
@@ -87,6 +88,9 @@ class APIServer:
         # WebSocket connections for real-time updates
         self.active_connections: List[WebSocket] = []
         
+        # Set once the background training task of a session has started
+        self.training_started = asyncio.Event()
+        
         # Configure CORS
         self.app.add_middleware(
             CORSMiddleware,
@@ -246,6 +250,7 @@ class APIServer:
                     raise HTTPException(status_code=500, detail="Failed to initialize training")
                 
                 # Start training in background
+                self.training_started.clear()
                 asyncio.create_task(self._run_training_background())
                 
                 await self._broadcast_update({
@@ -378,10 +383,13 @@ class APIServer:
         if not self.active_connections:
             return
         
+        # Encode once for all clients
+        payload = to_json(message).decode()
+        
         disconnected = []
         for connection in self.active_connections:
             try:
-                await connection.send_json(message)
+                await connection.send_text(payload)
             except Exception as e:
                 logger.error(f"Error sending to WebSocket: {e}")
                 disconnected.append(connection)
@@ -394,7 +402,7 @@ class APIServer:
         """Broadcast metrics update to all WebSocket clients."""
         await self._broadcast_update({
             "type": "metrics_update",
-            "metrics": metrics.model_dump(),
+            "metrics": metrics,
             "timestamp": datetime.now().isoformat()
         })
     
@@ -420,6 +428,7 @@ class APIServer:
     async def _run_training_background(self):
         """Run training in background and broadcast updates."""
         try:
+            self.training_started.set()
             # This would be called by the coordinator's training loop
             # For now, this is a placeholder
             logger.info("Background training task started")
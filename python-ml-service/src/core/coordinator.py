@@ -14,6 +14,8 @@ from datetime import datetime
 import pickle
 from pathlib import Path
 
+from pydantic import TypeAdapter
+
 from ..models.config import SystemConfig, TrainingConfig
 from ..models.node import NodeMetadata, NodeStatus, NodeRegistry
 from ..models.metrics import TrainingMetrics, AggregatedMetrics, NetworkMetrics
@@ -22,6 +24,9 @@ from .blockchain_integrator import BlockchainIntegrator
 
 logger = get_logger(__name__)
 
+# Validates a whole saved metrics history in one pydantic-core call
+_metrics_history_adapter = TypeAdapter(List[AggregatedMetrics])
+
 
 class TrainingCoordinator:
     """
@@ -137,7 +142,7 @@ class TrainingCoordinator:
                 # Start blockchain session
                 if self.blockchain_integrator:
                     logger.info("[Coordinator] Starting blockchain session...")
-                    model_name = self.training_config.model_architecture.value
+                    model_name = self.training_config.model_architecture
                     if not self.blockchain_integrator.start_session(model_name):
                         logger.error("[Coordinator] Failed to start blockchain session")
                         if self.config.blockchain.enabled:
@@ -443,12 +448,12 @@ class TrainingCoordinator:
                 self.total_steps = state["total_steps"]
                 self.is_training = state["is_training"]
                 self.is_initialized = state["is_initialized"]
-                self.node_registry = NodeRegistry(**state["node_registry"])
+                self.node_registry = NodeRegistry.model_validate(state["node_registry"])
                 self.node_health = state["node_health"]
                 self.node_performance = state["node_performance"]
-                self.metrics_history = [
-                    AggregatedMetrics(**m) for m in state["metrics_history"]
-                ]
+                self.metrics_history = _metrics_history_adapter.validate_python(
+                    state["metrics_history"]
+                )
                 
                 logger.info(f"Coordinator state loaded from {checkpoint_file}")
                 logger.info(f"Resumed at epoch {self.current_epoch}, step {self.current_step}")
@@ -494,7 +499,7 @@ class TrainingCoordinator:
         if self.blockchain_integrator:
             try:
                 self.blockchain_integrator.record_training_metrics(metrics)
-                logger.debug(f"[Coordinator] Recorded training metrics to blockchain: {metrics.node_id}")
+                logger.debug("[Coordinator] Recorded training metrics to blockchain: {}", metrics.node_id)
             except Exception as e:
                 logger.error(f"[Coordinator] Error recording training metrics: {e}")
     
@@ -508,7 +513,7 @@ class TrainingCoordinator:
         if self.blockchain_integrator:
             try:
                 self.blockchain_integrator.record_network_metrics(metrics)
-                logger.debug(f"[Coordinator] Recorded network metrics to blockchain: {metrics.node_id}")
+                logger.debug("[Coordinator] Recorded network metrics to blockchain: {}", metrics.node_id)
             except Exception as e:
                 logger.error(f"[Coordinator] Error recording network metrics: {e}")
     
@@ -525,7 +530,7 @@ class TrainingCoordinator:
         if self.blockchain_integrator:
             try:
                 self.blockchain_integrator.record_gradient_submission(node_id, accepted, gradient_norm)
-                logger.debug(f"[Coordinator] Recorded gradient submission: {node_id} accepted={accepted}")
+                logger.debug("[Coordinator] Recorded gradient submission: {} accepted={}", node_id, accepted)
             except Exception as e:
                 logger.error(f"[Coordinator] Error recording gradient submission: {e}")
     
@@ -25,6 +25,9 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Statuses in which a node may start a training step
+_TRAINABLE_STATUSES = frozenset({NodeStatus.READY, NodeStatus.TRAINING})
+
 
 class GPUNodeService:
     """
@@ -196,7 +199,7 @@ class GPUNodeService:
             Returns None if training step fails
         """
         with self.lock:
-            if self.status != NodeStatus.READY and self.status != NodeStatus.TRAINING:
+            if self.status not in _TRAINABLE_STATUSES:
                 logger.warning(f"[NODE {self.node_id}] Cannot train, status: {self.status}")
                 return None
             
@@ -299,8 +302,13 @@ class GPUNodeService:
                     }
                 }
                 
-                logger.debug(f"[NODE {self.node_id}] Step {self.steps_completed} complete, "
-                           f"loss: {loss.item():.4f}, grad_norm: {grad_norm:.4f}")
+                logger.opt(lazy=True).debug(
+                    "[NODE {}] Step {} complete, loss: {:.4f}, grad_norm: {:.4f}",
+                    lambda: self.node_id,
+                    lambda: self.steps_completed,
+                    lambda: loss.item(),
+                    lambda: grad_norm,
+                )
                 
                 return result
                 
@@ -50,7 +50,7 @@ class GradientAggregator:
             gradient_clip_value: Maximum gradient norm (None to disable)
             max_stale_rounds: Maximum age of stale gradients to accept
         """
-        self.strategy = strategy
+        self.strategy = AggregationStrategy(strategy)
         self.timeout_seconds = timeout_seconds
         self.min_nodes_percentage = min_nodes_percentage
         self.gradient_clip_value = gradient_clip_value
@@ -76,7 +76,7 @@ class GradientAggregator:
         self.lock = threading.RLock()
         
         logger.info(
-            f"GradientAggregator initialized: strategy={strategy.value}, "
+            f"GradientAggregator initialized: strategy={self.strategy.value}, "
             f"timeout={timeout_seconds}s, clip={gradient_clip_value}"
         )
     
@@ -437,7 +437,7 @@ class GradientAggregator:
         """
         with self.lock:
             self.node_weights[node_id] = weight
-            logger.debug(f"Node {node_id} weight updated to {weight:.3f}")
+            logger.debug("Node {} weight updated to {:.3f}", node_id, weight)
     
     def _validate_gradients(
         self,
@@ -513,7 +513,7 @@ class GradientAggregator:
                 name: grad * clip_coef
                 for name, grad in gradients.items()
             }
-            logger.debug(f"Gradients clipped: norm={total_norm:.4f} -> {self.gradient_clip_value}")
+            logger.debug("Gradients clipped: norm={:.4f} -> {}", total_norm, self.gradient_clip_value)
             return clipped_gradients
         
         return gradients
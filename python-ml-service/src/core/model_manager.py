@@ -81,9 +81,9 @@ class ModelManager:
         model_class = self.ARCHITECTURES[arch]
         
         # Configure based on dataset
-        if self.config.dataset.value == "mnist":
+        if self.config.dataset == "mnist":
             self.model = model_class(num_classes=10, input_channels=1)
-        elif self.config.dataset.value == "cifar10":
+        elif self.config.dataset == "cifar10":
             self.model = model_class(num_classes=10, input_channels=3)
         else:
             self.model = model_class()
@@ -92,7 +92,7 @@ class ModelManager:
         device = torch.device(self.config.device)
         self.model = self.model.to(device)
         
-        logger.info(f"[ModelManager] Created {arch.value} model on {device}")
+        logger.info(f"[ModelManager] Created {arch} model on {device}")
         return self.model
     
     def create_optimizer(self, model: nn.Module) -> optim.Optimizer:
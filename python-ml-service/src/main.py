@@ -21,7 +21,7 @@ def parse_arguments():
     
     parser.add_argument(
         "--config",
-        type=str,
+        type=Path,
         default="configs/default.json",
         help="Path to configuration file",
     )
@@ -68,15 +68,15 @@ def main():
     logger.info("✓ System requirements satisfied")
     
     # Load configuration
-    logger.info(f"Loading configuration from: {args.config}")
+    logger.info("Loading configuration from: {}", args.config)
     try:
         config = SystemConfig.from_file(args.config)
         logger.info("✓ Configuration loaded successfully")
     except FileNotFoundError:
-        logger.error(f"Configuration file not found: {args.config}")
+        logger.error("Configuration file not found: {}", args.config)
         return 1
     except Exception as e:
-        logger.error(f"Error loading configuration: {e}")
+        logger.error("Error loading configuration: {}", e)
         return 1
     
     # Validate configuration
@@ -86,7 +86,7 @@ def main():
     if not is_valid:
         logger.error("Configuration validation failed:")
         for error in errors:
-            logger.error(f"  - {error}")
+            logger.error("  - {}", error)
         return 1
     
     logger.info("✓ Configuration valid")
@@ -99,15 +99,15 @@ def main():
     # Display configuration summary
     logger.info("")
     logger.info("Configuration Summary:")
-    logger.info(f"  Model: {config.training.model_architecture.value}")
-    logger.info(f"  Dataset: {config.training.dataset.value}")
-    logger.info(f"  Learning Rate: {config.training.learning_rate}")
-    logger.info(f"  Batch Size: {config.training.batch_size}")
-    logger.info(f"  Epochs: {config.training.epochs}")
-    logger.info(f"  Number of Nodes: {config.training.num_nodes}")
-    logger.info(f"  Device: {config.training.device}")
-    logger.info(f"  Network Simulation: {'Enabled' if config.network.enable_simulation else 'Disabled'}")
-    logger.info(f"  Blockchain Integration: {'Enabled' if config.blockchain.enabled else 'Disabled'}")
+    logger.info("  Model: {}", config.training.model_architecture)
+    logger.info("  Dataset: {}", config.training.dataset)
+    logger.info("  Learning Rate: {}", config.training.learning_rate)
+    logger.info("  Batch Size: {}", config.training.batch_size)
+    logger.info("  Epochs: {}", config.training.epochs)
+    logger.info("  Number of Nodes: {}", config.training.num_nodes)
+    logger.info("  Device: {}", config.training.device)
+    logger.info("  Network Simulation: {}", "Enabled" if config.network.enable_simulation else "Disabled")
+    logger.info("  Blockchain Integration: {}", "Enabled" if config.blockchain.enabled else "Disabled")
     logger.info("")
     
     logger.info("Training coordinator initialization will be implemented in Phase 2")
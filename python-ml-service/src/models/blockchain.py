@@ -2,13 +2,33 @@
 Blockchain contribution tracking models.
 """
 
-from typing import Optional, Dict, List
-from pydantic import BaseModel, Field
+from typing import Any, Optional, Dict, Iterable, List, Tuple, Union
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    computed_field,
+    model_validator,
+)
+from pydantic.dataclasses import dataclass
 from datetime import datetime
+import time
+import numpy as np
 
+from .timestamps import ns_to_datetime, timestamp_input_to_ns
 
-class BlockchainContribution(BaseModel):
-    """Node contribution data for blockchain recording."""
+
+@dataclass(config=ConfigDict(extra="forbid"), slots=True, kw_only=True)
+class BlockchainContribution:
+    """
+    Node contribution data for blockchain recording.
+    
+    Declared as a slotted pydantic dataclass rather than a BaseModel: sessions
+    can hold very many of these records, and dropping the per-instance
+    __dict__ cuts their memory footprint several times over.
+    """
     
     # Identity
     node_id: str = Field(..., description="Node identifier")
@@ -56,11 +76,23 @@ class BlockchainContribution(BaseModel):
     block_number: Optional[int] = Field(None, description="Block number")
     
     # Timestamp
-    timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
-        description="When contribution was recorded"
+    timestamp_ns: int = Field(
+        default_factory=time.time_ns,
+        description="When contribution was recorded (epoch nanoseconds)"
     )
     
+    @model_validator(mode="before")
+    @classmethod
+    def _timestamp_to_ns(cls, data: Any) -> Any:
+        # Accept the computed timestamp from dumps despite extra="forbid"
+        return timestamp_input_to_ns(data)
+    
+    @computed_field
+    @property
+    def timestamp(self) -> datetime:
+        """When contribution was recorded, as a UTC datetime."""
+        return ns_to_datetime(self.timestamp_ns)
+    
     def calculate_contribution_score(self) -> float:
         """
         Calculate overall contribution score based on multiple factors.
@@ -68,28 +100,231 @@ class BlockchainContribution(BaseModel):
         Formula:
         score = compute_time * gradient_quality * network_reliability * acceptance_rate
         """
-        # Calculate acceptance rate
-        total_gradients = self.gradients_accepted + self.gradients_rejected
-        if total_gradients > 0:
-            acceptance_rate = self.gradients_accepted / total_gradients
-        else:
-            acceptance_rate = 1.0
+        # Read each slot once; the formula below reuses the locals
+        compute_time = self.compute_time_seconds
+        rejected = self.gradients_rejected
+        gradient_quality = self.gradient_quality_score
+        network_reliability = self.network_reliability_score
         
-        # Calculate score
-        score = (
-            self.compute_time_seconds *
-            self.gradient_quality_score *
-            self.network_reliability_score *
-            acceptance_rate
-        )
+        # Common case: perfect quality/reliability and no rejections
+        if rejected == 0 and gradient_quality == 1.0 and network_reliability == 1.0:
+            score = compute_time
+        else:
+            accepted = self.gradients_accepted
+            total_gradients = accepted + rejected
+            acceptance_rate = accepted / total_gradients if total_gradients > 0 else 1.0
+            score = compute_time * gradient_quality * network_reliability * acceptance_rate
         
         self.contribution_score = score
         return score
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return _contribution_adapter.dump_python(self)
+
+
+_contribution_adapter = TypeAdapter(BlockchainContribution)
+_contribution_list_adapter = TypeAdapter(List[BlockchainContribution])
+
+
+def load_contributions_json(data: Union[str, bytes]) -> List[BlockchainContribution]:
+    """
+    Decode a JSON array of contributions in one pass.
+    
+    Parsing and validation both run inside pydantic-core, so bulk ingest
+    skips the intermediate ``json.loads`` dicts and per-record constructor
+    calls.
+    
+    Args:
+        data: JSON array of contribution objects
+        
+    Returns:
+        List of validated contributions
+    """
+    return _contribution_list_adapter.validate_json(data)
+
+
+class SessionContributionStore:
+    """
+    Columnar (structure-of-arrays) storage for session contributions.
+    
+    Every contribution field used for scoring lives in its own contiguous
+    NumPy column, so scoring and per-node aggregation run as a few
+    vectorized operations instead of attribute lookups on each record.
+    Node IDs are stored as integer codes into ``node_ids``.
+    
+    Quality and reliability lie in [0, 1] and are stored as float32 to
+    halve the bytes those columns move. Compute time and score stay
+    float64, since rewards paid on-chain are derived from them. Counters
+    are int64 since the model does not bound them.
+    """
+    
+    _COLUMNS = {
+        "node_index": np.int32,
+        "compute_time": np.float64,
+        "gradient_quality": np.float32,
+        "network_reliability": np.float32,
+        "gradients_accepted": np.int64,
+        "gradients_rejected": np.int64,
+        "samples_processed": np.int64,
+        "contribution_score": np.float64,
+    }
+    
+    def __init__(self, capacity: int = 64):
+        self._size = 0
+        self._capacity = max(1, capacity)
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.empty(self._capacity, dtype=dtype)
+            for name, dtype in self._COLUMNS.items()
         }
+        self._node_ids: List[str] = []
+        self._node_codes: Dict[str, int] = {}
+        # Row numbers per node code, for single-node queries
+        self._node_rows: List[List[int]] = []
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    @property
+    def node_ids(self) -> List[str]:
+        """Node IDs in first-seen order; ``node_index`` values index into this."""
+        return self._node_ids
+    
+    def column(self, name: str) -> np.ndarray:
+        """Get a view of a column trimmed to the stored rows."""
+        return self._columns[name][:self._size]
+    
+    def add_contribution(self, contribution: BlockchainContribution):
+        """Append a contribution as a new row."""
+        if self._size == self._capacity:
+            self._grow()
+        
+        node_code = self._node_codes.get(contribution.node_id)
+        if node_code is None:
+            node_code = len(self._node_ids)
+            self._node_codes[contribution.node_id] = node_code
+            self._node_ids.append(contribution.node_id)
+            self._node_rows.append([])
+        
+        row = self._size
+        columns = self._columns
+        columns["node_index"][row] = node_code
+        columns["compute_time"][row] = contribution.compute_time_seconds
+        columns["gradient_quality"][row] = contribution.gradient_quality_score
+        columns["network_reliability"][row] = contribution.network_reliability_score
+        columns["gradients_accepted"][row] = contribution.gradients_accepted
+        columns["gradients_rejected"][row] = contribution.gradients_rejected
+        columns["samples_processed"][row] = contribution.samples_processed
+        columns["contribution_score"][row] = contribution.contribution_score
+        self._node_rows[node_code].append(row)
+        self._size += 1
+    
+    def reserve(self, capacity: int):
+        """Ensure room for at least ``capacity`` rows without regrowing."""
+        if capacity > self._capacity:
+            self._resize(capacity)
+    
+    def _grow(self):
+        """Double the capacity of every column, keeping existing rows."""
+        self._resize(self._capacity * 2)
+    
+    def _resize(self, capacity: int):
+        """Reallocate every column to ``capacity`` rows, keeping existing rows."""
+        self._capacity = capacity
+        for name, column in self._columns.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+    
+    def calculate_contribution_scores(self) -> np.ndarray:
+        """
+        Score every row at once.
+        
+        Vectorized equivalent of BlockchainContribution.calculate_contribution_score;
+        the result is also written back to the ``contribution_score`` column.
+        """
+        accepted = self.column("gradients_accepted")
+        total_gradients = accepted + self.column("gradients_rejected")
+        acceptance_rate = np.divide(
+            accepted,
+            total_gradients,
+            out=np.ones(self._size, dtype=np.float64),
+            where=total_gradients > 0,
+        )
+        
+        scores = (
+            self.column("compute_time") *
+            self.column("gradient_quality") *
+            self.column("network_reliability") *
+            acceptance_rate
+        )
+        
+        self.column("contribution_score")[:] = scores
+        return scores
+    
+    def get_node_total(self, node_id: str) -> float:
+        """Get total contribution score for one node, summing only its rows."""
+        node_code = self._node_codes.get(node_id)
+        if node_code is None:
+            return 0.0
+        scores = self._columns["contribution_score"][self._node_rows[node_code]]
+        return float(scores.sum())
+    
+    def get_node_totals(self) -> np.ndarray:
+        """Get total contribution score per node (float64), aligned with ``node_ids``."""
+        return np.bincount(
+            self.column("node_index"),
+            weights=self.column("contribution_score"),
+            minlength=len(self._node_ids),
+        )
+    
+    def _calculate_rewards(self, total_reward_pool: float) -> np.ndarray:
+        """Get reward amount per node, aligned with ``node_ids``."""
+        node_totals = self.get_node_totals()
+        total_score = node_totals.sum()
+        
+        if total_score == 0:
+            # Equal distribution if no meaningful contributions
+            return np.full(len(node_totals), total_reward_pool / len(node_totals))
+        
+        return node_totals / total_score * total_reward_pool
+    
+    def calculate_reward_distribution(
+        self, total_reward_pool: float
+    ) -> Dict[str, float]:
+        """
+        Calculate reward distribution from the stored contribution scores.
+        
+        Args:
+            total_reward_pool: Total rewards to distribute
+            
+        Returns:
+            Dictionary mapping node_id to reward amount
+        """
+        rewards = self._calculate_rewards(total_reward_pool)
+        return dict(zip(self._node_ids, rewards.tolist()))
+    
+    def calculate_reward_distribution_array(
+        self, total_reward_pool: float
+    ) -> np.recarray:
+        """
+        Calculate reward distribution as a columnar record array.
+        
+        Avoids building a per-node Python dict for large sessions; the
+        result can be written out directly (e.g. ``np.save`` or
+        ``tobytes()``) or handed to tabular tools.
+        
+        Args:
+            total_reward_pool: Total rewards to distribute
+            
+        Returns:
+            Record array with ``node_id`` (str) and ``reward`` (float64) fields
+        """
+        rewards = self._calculate_rewards(total_reward_pool)
+        return np.rec.fromarrays(
+            [np.array(self._node_ids, dtype=str), rewards],
+            names="node_id,reward",
+        )
 
 
 class SessionContributions(BaseModel):
@@ -102,9 +337,9 @@ class SessionContributions(BaseModel):
     )
     
     # Session Info
-    start_time: datetime = Field(
-        default_factory=datetime.utcnow,
-        description="Session start time"
+    start_time_ns: int = Field(
+        default_factory=time.time_ns,
+        description="Session start time (epoch nanoseconds)"
     )
     end_time: Optional[datetime] = Field(None, description="Session end time")
     total_epochs: int = Field(default=0, ge=0, description="Total epochs")
@@ -113,25 +348,75 @@ class SessionContributions(BaseModel):
     total_compute_time: float = Field(default=0.0, ge=0, description="Total compute time")
     total_samples_processed: int = Field(default=0, ge=0, description="Total samples")
     
+    @computed_field
+    @property
+    def start_time(self) -> datetime:
+        """Session start time, as a UTC datetime."""
+        return ns_to_datetime(self.start_time_ns)
+    
+    # Columnar view of the contributions, maintained by add_contribution
+    _store: SessionContributionStore = PrivateAttr(default_factory=SessionContributionStore)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Seed the columnar store from initial contributions."""
+        for contributions in self.contributions.values():
+            for contribution in contributions:
+                self._store.add_contribution(contribution)
+    
+    @property
+    def store(self) -> SessionContributionStore:
+        """Columnar view of all contributions, for vectorized aggregation."""
+        return self._store
+    
     def add_contribution(self, contribution: BlockchainContribution):
-        """Add a contribution for a node."""
+        """
+        Add a contribution for a node.
+        
+        A contribution that has not been scored yet (score 0) is scored
+        here, so its score is fixed from the moment it is added and the
+        columnar store never needs re-syncing.
+        """
+        if contribution.contribution_score == 0:
+            contribution.calculate_contribution_score()
+        
         node_id = contribution.node_id
-        if node_id not in self.contributions:
-            self.contributions[node_id] = []
-        self.contributions[node_id].append(contribution)
+        node_contributions = self.contributions.get(node_id)
+        if node_contributions is None:
+            node_contributions = self.contributions[node_id] = []
+        node_contributions.append(contribution)
         
         # Update aggregates
         self.total_compute_time += contribution.compute_time_seconds
         self.total_samples_processed += contribution.samples_processed
+        self._store.add_contribution(contribution)
+    
+    def register_nodes(self, node_ids: Iterable[str]):
+        """
+        Pre-register the nodes expected to contribute.
+        
+        Seeds an empty contribution list for each new node, and when
+        total_epochs is known reserves one columnar row per node per epoch.
+        """
+        node_ids = [node_id for node_id in node_ids if node_id not in self.contributions]
+        for node_id in node_ids:
+            self.contributions[node_id] = []
+        
+        if self.total_epochs > 0:
+            self._store.reserve(len(self._store) + len(node_ids) * self.total_epochs)
     
     def get_node_contributions(self, node_id: str) -> List[BlockchainContribution]:
         """Get all contributions for a specific node."""
         return self.contributions.get(node_id, [])
     
+    def _node_totals(self) -> Dict[str, float]:
+        """Total contribution score per node, zero for nodes with no contributions."""
+        totals = dict.fromkeys(self.contributions, 0.0)
+        totals.update(zip(self._store.node_ids, self._store.get_node_totals().tolist()))
+        return totals
+    
     def get_total_contribution_score(self, node_id: str) -> float:
         """Get total contribution score for a node."""
-        contributions = self.get_node_contributions(node_id)
-        return sum(c.contribution_score for c in contributions)
+        return self._store.get_node_total(node_id)
     
     def get_all_nodes(self) -> List[str]:
         """Get list of all contributing nodes."""
@@ -149,30 +434,19 @@ class SessionContributions(BaseModel):
         Returns:
             Dictionary mapping node_id to reward amount
         """
-        # Calculate total contribution score
-        total_score = sum(
-            self.get_total_contribution_score(node_id)
-            for node_id in self.get_all_nodes()
+        node_totals = self._node_totals()
+        node_scores = np.fromiter(
+            node_totals.values(), dtype=np.float64, count=len(node_totals)
         )
+        total_score = node_scores.sum()
         
         if total_score == 0:
             # Equal distribution if no meaningful contributions
-            num_nodes = len(self.get_all_nodes())
-            return {
-                node_id: total_reward_pool / num_nodes
-                for node_id in self.get_all_nodes()
-            }
-        
-        # Proportional distribution
-        return {
-            node_id: (self.get_total_contribution_score(node_id) / total_score) * total_reward_pool
-            for node_id in self.get_all_nodes()
-        }
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
+            return dict.fromkeys(node_totals, total_reward_pool / len(node_totals))
+        
+        # Proportional distribution, as one array pass over the node totals
+        rewards = node_scores / total_score * total_reward_pool
+        return dict(zip(node_totals, rewards.tolist()))
 
 
 class RewardDistribution(BaseModel):
@@ -203,23 +477,51 @@ class RewardDistribution(BaseModel):
     )
     
     # Timestamp
-    timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
-        description="When distribution was calculated"
+    timestamp_ns: int = Field(
+        default_factory=time.time_ns,
+        description="When distribution was calculated (epoch nanoseconds)"
     )
     
+    @computed_field
+    @property
+    def timestamp(self) -> datetime:
+        """When distribution was calculated, as a UTC datetime."""
+        return ns_to_datetime(self.timestamp_ns)
+    
+    # Rewards still awaiting a transaction hash
+    _remaining: int = PrivateAttr(default=0)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Count rewards that do not have a transaction hash yet."""
+        self._remaining = sum(
+            1 for node_id in self.rewards if node_id not in self.transaction_hashes
+        )
+    
     def get_node_reward(self, node_id: str) -> float:
         """Get reward for specific node."""
         return self.rewards.get(node_id, 0.0)
     
     def mark_distributed(self, node_id: str, tx_hash: str):
-        """Mark reward as distributed for a node."""
-        self.transaction_hashes[node_id] = tx_hash
+        """
+        Mark reward as distributed for a node.
+        
+        Prefer mark_distributed_many when recording several transactions.
+        """
+        self.mark_distributed_many([(node_id, tx_hash)])
+    
+    def mark_distributed_many(self, pairs: Iterable[Tuple[str, str]]):
+        """
+        Mark rewards as distributed for several nodes at once.
+        
+        Args:
+            pairs: (node_id, tx_hash) pairs
+        """
+        transaction_hashes = self.transaction_hashes
+        for node_id, tx_hash in pairs:
+            if node_id not in transaction_hashes and node_id in self.rewards:
+                self._remaining -= 1
+            transaction_hashes[node_id] = tx_hash
+        
         # Check if all distributed
-        if len(self.transaction_hashes) == len(self.rewards):
+        if self._remaining <= 0:
             self.distributed = True
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
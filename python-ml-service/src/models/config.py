@@ -2,10 +2,13 @@
 Configuration data models using Pydantic for validation.
 """
 
-from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field, field_validator
+from typing import Optional, Dict, Any, List, Tuple, Union
+from pathlib import Path
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from enum import Enum
+import functools
 import json
+import os
 
 
 class DatasetType(str, Enum):
@@ -32,18 +35,48 @@ class AggregationStrategy(str, Enum):
     FEDERATED_AVERAGING = "federated_averaging"
 
 
+@functools.lru_cache(maxsize=32)
+def _load_config_file(model_cls: type, filepath: str, file_key: Tuple[int, int, int]) -> BaseModel:
+    """
+    Parse and validate a JSON config file.
+    
+    Cached per (model class, path, file identity), so re-reading an unchanged
+    file skips the JSON parse and validation while an edited file is reloaded.
+    The raw bytes are validated directly by pydantic-core, without an
+    intermediate decoded string or dict.
+    """
+    return model_cls.model_validate_json(Path(filepath).read_bytes())
+
+
+def _from_file_cached(model_cls: type, filepath: Union[str, Path]) -> BaseModel:
+    """Load a config through the file cache, returning a private copy."""
+    filepath = os.path.abspath(filepath)
+    stat = os.stat(filepath)
+    # mtime alone misses edits within the filesystem's timestamp granularity
+    # and files replaced by rename; size and inode catch most of those
+    file_key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    return _load_config_file(model_cls, filepath, file_key).model_copy(deep=True)
+
+
 class TrainingConfig(BaseModel):
-    """Main training configuration."""
+    """
+    Main training configuration.
+    
+    Enum fields are stored as their plain string values (use_enum_values),
+    so comparing against enum members still works but ``.value`` is not needed.
+    """
+    
+    model_config = ConfigDict(use_enum_values=True)
     
     # Model Configuration
     model_architecture: ModelArchitecture = Field(
-        default=ModelArchitecture.SIMPLE_CNN,
+        default=ModelArchitecture.SIMPLE_CNN.value,
         description="Neural network architecture to use"
     )
     
     # Dataset Configuration
     dataset: DatasetType = Field(
-        default=DatasetType.MNIST,
+        default=DatasetType.MNIST.value,
         description="Dataset to train on"
     )
     dataset_path: Optional[str] = Field(
@@ -83,7 +116,7 @@ class TrainingConfig(BaseModel):
         description="Number of GPU nodes to simulate"
     )
     aggregation_strategy: AggregationStrategy = Field(
-        default=AggregationStrategy.SIMPLE_AVERAGE,
+        default=AggregationStrategy.SIMPLE_AVERAGE.value,
         description="Gradient aggregation method"
     )
     synchronous: bool = Field(
@@ -125,11 +158,9 @@ class TrainingConfig(BaseModel):
         return v
     
     @classmethod
-    def from_file(cls, filepath: str) -> "TrainingConfig":
+    def from_file(cls, filepath: Union[str, Path]) -> "TrainingConfig":
         """Load configuration from JSON file."""
-        with open(filepath, 'r') as f:
-            config_dict = json.load(f)
-        return cls(**config_dict)
+        return _from_file_cached(cls, filepath)
     
     def to_file(self, filepath: str):
         """Save configuration to JSON file."""
@@ -322,11 +353,9 @@ class SystemConfig(BaseModel):
     )
     
     @classmethod
-    def from_file(cls, filepath: str) -> "SystemConfig":
+    def from_file(cls, filepath: Union[str, Path]) -> "SystemConfig":
         """Load complete configuration from JSON file."""
-        with open(filepath, 'r') as f:
-            config_dict = json.load(f)
-        return cls(**config_dict)
+        return _from_file_cached(cls, filepath)
     
     def to_file(self, filepath: str):
         """Save configuration to JSON file."""
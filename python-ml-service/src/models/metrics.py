@@ -2,15 +2,170 @@
 Metrics data models for training, network, and gradient updates.
 """
 
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any, Callable, Literal, Tuple, Union
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    computed_field,
+    ValidationInfo,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+from pydantic_core import to_json as _core_to_json
+from dataclasses import dataclass, field
 from datetime import datetime
+import functools
+import time
 import numpy as np
 
+from .timestamps import ns_to_datetime, timestamp_input_to_ns
+
+
+# Network quality score weights (sum to 1) and latency normalization
+# (1000ms = latency score 0); shared by the scalar and vectorized versions
+_LATENCY_WEIGHT = 0.4
+_LOSS_WEIGHT = 0.3
+_SUCCESS_WEIGHT = 0.3
+_LATENCY_SCALE = 1e-3
+
+
+def _network_quality_score(
+    latency_ms: float,
+    packet_loss_rate: float,
+    messages_sent: int,
+    messages_failed: int,
+) -> float:
+    """
+    Weighted network quality score in [0, 1].
+    
+    Kept as a plain function over scalars, off the model, so the hot path
+    does not go through BaseModel attribute access.
+    """
+    # A perfect link scores 1.0 on every component
+    if messages_failed == 0 and latency_ms == 0.0 and packet_loss_rate == 0.0:
+        return 1.0
+    
+    # Latency score (lower is better, normalized to 0-1); a compare is
+    # cheaper than calling max()
+    latency_score = 1.0 - latency_ms * _LATENCY_SCALE
+    if latency_score < 0.0:
+        latency_score = 0.0
+    
+    # Success rate score
+    total_messages = messages_sent + messages_failed
+    success_score = messages_sent / total_messages if total_messages > 0 else 1.0
+    
+    # Weighted average; the loss score is 1 - packet_loss_rate
+    return (
+        _LATENCY_WEIGHT * latency_score
+        + _LOSS_WEIGHT * (1.0 - packet_loss_rate)
+        + _SUCCESS_WEIGHT * success_score
+    )
+
+
+def calculate_quality_scores(
+    latency_ms: np.ndarray,
+    packet_loss_rate: np.ndarray,
+    messages_sent: np.ndarray,
+    messages_failed: np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorized network quality scores, one per element of the inputs.
+    
+    Same formula as NetworkMetrics.calculate_quality_score, computed with
+    array operations for many nodes or measurement windows at once.
+    
+    Args:
+        latency_ms: Round-trip latencies in milliseconds
+        packet_loss_rate: Packet loss rates (0-1)
+        messages_sent: Messages sent
+        messages_failed: Failed transmissions
+        
+    Returns:
+        Quality scores as a float64 array
+    """
+    latency_ms = np.asarray(latency_ms, dtype=np.float64)
+    packet_loss_rate = np.asarray(packet_loss_rate, dtype=np.float64)
+    messages_sent = np.asarray(messages_sent, dtype=np.float64)
+    total_messages = messages_sent + np.asarray(messages_failed, dtype=np.float64)
+    
+    latency_score = np.maximum(1.0 - latency_ms * _LATENCY_SCALE, 0.0)
+    loss_score = 1.0 - packet_loss_rate
+    success_score = np.ones_like(total_messages)
+    np.divide(messages_sent, total_messages, out=success_score, where=total_messages > 0)
+    
+    return _LATENCY_WEIGHT * latency_score + _LOSS_WEIGHT * loss_score + _SUCCESS_WEIGHT * success_score
+
+
+def to_json(obj: Any) -> bytes:
+    """
+    Serialize a model, or plain data containing models, to JSON bytes.
+    
+    Encoding runs in pydantic-core, datetimes included, so no per-field
+    Python encoder is called.
+    """
+    return _core_to_json(obj)
+
+
+# Elements checked per np.isfinite call in _all_finite
+_FINITE_CHECK_CHUNK = 1 << 16
+
+
+def _all_finite(buffer: np.ndarray) -> bool:
+    """
+    Return True if a 1-D float buffer has no NaN or Inf values.
+    
+    Works through the buffer in fixed-size chunks with one reused boolean
+    scratch array, so memory stays bounded and the scan stops at the first
+    bad chunk. NumPy releases the GIL inside the ufunc loop, so updates
+    validated from different threads do not serialize on it.
+    """
+    size = buffer.size
+    if size <= _FINITE_CHECK_CHUNK:
+        return bool(np.isfinite(buffer).all())
+    
+    scratch = np.empty(_FINITE_CHECK_CHUNK, dtype=bool)
+    for start in range(0, size, _FINITE_CHECK_CHUNK):
+        chunk = buffer[start:start + _FINITE_CHECK_CHUNK]
+        mask = scratch[:chunk.size]
+        np.isfinite(chunk, out=mask)
+        if not mask.all():
+            return False
+    return True
+
+
+@functools.lru_cache(maxsize=64)
+def _shape_validator(shapes: Tuple[Tuple[int, ...], ...]) -> Callable[[np.ndarray], bool]:
+    """
+    Build a buffer validator specialized for one set of tensor shapes.
+    
+    The model is fixed for a session, so the same shapes arrive with every
+    update; the element total is computed once here instead of per call.
+    """
+    total_size = 0
+    for shape in shapes:
+        size = 1
+        for dim in shape:
+            size *= dim
+        total_size += size
+    
+    def validate(buffer: np.ndarray) -> bool:
+        return buffer.size == total_size and _all_finite(buffer)
+    
+    return validate
+
 
 class TrainingMetrics(BaseModel):
     """Training performance metrics."""
     
+    # Recorded once and never edited
+    model_config = ConfigDict(frozen=True)
+    
     # Identity
     node_id: str = Field(..., description="Node that generated these metrics")
     epoch: int = Field(..., ge=0, description="Current epoch")
@@ -31,25 +186,42 @@ class TrainingMetrics(BaseModel):
     gradient_std: Optional[float] = Field(None, description="Gradient standard deviation")
     
     # Timestamp
-    timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
-        description="When metrics were recorded"
+    timestamp_ns: int = Field(
+        default_factory=time.time_ns,
+        description="When metrics were recorded (epoch nanoseconds)"
     )
     
+    @model_validator(mode="before")
+    @classmethod
+    def _timestamp_to_ns(cls, data: Any) -> Any:
+        # A timestamp= datetime is stored as timestamp_ns rather than dropped
+        return timestamp_input_to_ns(data)
+    
+    @computed_field
+    @property
+    def timestamp(self) -> datetime:
+        """When metrics were recorded, as a UTC datetime."""
+        return ns_to_datetime(self.timestamp_ns)
+    
     # Additional Info
     metadata: Dict[str, Any] = Field(
         default_factory=dict,
         description="Additional custom metrics"
     )
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
 
 
-class NetworkMetrics(BaseModel):
-    """Network performance and quality metrics."""
+_training_metrics_list_adapter = TypeAdapter(List[TrainingMetrics])
+
+
+@pydantic_dataclass(config=ConfigDict(extra="forbid"), slots=True, kw_only=True)
+class NetworkMetrics:
+    """
+    Network performance and quality metrics.
+    
+    A slotted pydantic dataclass rather than a BaseModel: one is recorded
+    per node per measurement window, and dropping the per-instance
+    __dict__ keeps long histories small.
+    """
     
     # Identity
     node_id: str = Field(..., description="Node being measured")
@@ -103,11 +275,23 @@ class NetworkMetrics(BaseModel):
     )
     
     # Timestamp
-    timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
-        description="When metrics were measured"
+    timestamp_ns: int = Field(
+        default_factory=time.time_ns,
+        description="When metrics were measured (epoch nanoseconds)"
     )
     
+    @model_validator(mode="before")
+    @classmethod
+    def _timestamp_to_ns(cls, data: Any) -> Any:
+        # A timestamp= datetime is stored as timestamp_ns rather than dropped
+        return timestamp_input_to_ns(data)
+    
+    @computed_field
+    @property
+    def timestamp(self) -> datetime:
+        """When metrics were measured, as a UTC datetime."""
+        return ns_to_datetime(self.timestamp_ns)
+    
     # Measurement Window
     window_seconds: float = Field(
         default=10.0,
@@ -117,34 +301,22 @@ class NetworkMetrics(BaseModel):
     
     def calculate_quality_score(self) -> float:
         """Calculate overall network quality score."""
-        # Latency score (lower is better, normalized to 0-1)
-        latency_score = max(0, 1 - (self.latency_ms / 1000))  # 1000ms = score 0
-        
-        # Packet loss score
-        loss_score = 1 - self.packet_loss_rate
-        
-        # Success rate score
-        total_messages = self.messages_sent + self.messages_failed
-        if total_messages > 0:
-            success_score = self.messages_sent / total_messages
-        else:
-            success_score = 1.0
-        
-        # Weighted average
-        quality = (0.4 * latency_score + 0.3 * loss_score + 0.3 * success_score)
-        
+        quality = _network_quality_score(
+            self.latency_ms,
+            self.packet_loss_rate,
+            self.messages_sent,
+            self.messages_failed,
+        )
         self.quality_score = quality
         return quality
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
 
 
 class GradientUpdate(BaseModel):
     """Gradient update transmission format."""
     
+    # gradient_data holds NumPy arrays
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
     # Identity
     node_id: str = Field(..., description="Node submitting gradients")
     update_id: str = Field(..., description="Unique update identifier")
@@ -154,8 +326,19 @@ class GradientUpdate(BaseModel):
     step: int = Field(..., ge=0, description="Step number")
     batch_size: int = Field(..., gt=0, description="Batch size used")
     
-    # Gradient Data (serialized as list for JSON compatibility)
-    gradient_data: List[List[float]] = Field(
+    # Element type of gradient_data; int8 tensors are scaled by gradient_scales
+    gradient_dtype: Literal["float32", "float16", "int8"] = Field(
+        default="float32",
+        description="Element type of gradient data on the wire"
+    )
+    gradient_scales: Optional[List[float]] = Field(
+        None,
+        description="Per-tensor dequantization scales for int8 gradients"
+    )
+    
+    # Gradient Data (serialized as list for JSON compatibility). Tensors are
+    # stored as views into one contiguous buffer; see gradient_buffer.
+    gradient_data: List[np.ndarray] = Field(
         ...,
         description="Flattened gradient tensors"
     )
@@ -191,14 +374,158 @@ class GradientUpdate(BaseModel):
     error_message: Optional[str] = Field(None, description="Error if failed")
     
     # Timestamp
-    timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
-        description="When update was created"
+    timestamp_ns: int = Field(
+        default_factory=time.time_ns,
+        description="When update was created (epoch nanoseconds)"
     )
     
+    @model_validator(mode="before")
+    @classmethod
+    def _timestamp_to_ns(cls, data: Any) -> Any:
+        # A timestamp= datetime is stored as timestamp_ns rather than dropped
+        return timestamp_input_to_ns(data)
+    
+    @computed_field
+    @property
+    def timestamp(self) -> datetime:
+        """When update was created, as a UTC datetime."""
+        return ns_to_datetime(self.timestamp_ns)
+    
     # Validation
     checksum: Optional[str] = Field(None, description="Data integrity checksum")
     
+    # Contiguous buffer backing gradient_data
+    _gradient_buffer: np.ndarray = PrivateAttr(
+        default_factory=lambda: np.empty(0, dtype=np.float32)
+    )
+    
+    @field_validator("gradient_data", mode="before")
+    @classmethod
+    def _coerce_gradient_data(cls, v: Any, info: ValidationInfo) -> Any:
+        """
+        Accept nested lists or arrays and store each tensor as 1-D gradient_dtype.
+        
+        Tensors exposing the buffer protocol (``array.array('f')``,
+        ``memoryview``, ndarrays) are read in place rather than through a
+        list of Python floats.
+        """
+        dtype = info.data.get("gradient_dtype", "float32")
+        if isinstance(v, np.ndarray) and v.ndim == 1:
+            v = [v]
+        return [np.asarray(tensor, dtype=dtype).ravel() for tensor in v]
+    
+    @field_serializer("gradient_data")
+    def _serialize_gradient_data(self, value: List[np.ndarray]) -> List[List[float]]:
+        return [tensor.tolist() for tensor in value]
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Pack all tensors into one buffer and keep views into it."""
+        if self.gradient_data:
+            self._pack_tensors(self.gradient_data)
+    
+    @classmethod
+    def from_bytes(
+        cls,
+        data: Union[bytes, bytearray, memoryview],
+        gradient_shapes: List[List[int]],
+        gradient_dtype: Literal["float32", "float16", "int8"] = "float32",
+        **fields: Any
+    ) -> "GradientUpdate":
+        """
+        Build an update from one raw buffer holding every tensor back to back.
+        
+        The buffer is split into per-tensor views by ``gradient_shapes`` and
+        copied once into the update's own contiguous buffer, with no
+        intermediate Python floats.
+        
+        Args:
+            data: Raw gradient values in ``gradient_dtype``
+            gradient_shapes: Shapes of the tensors, in buffer order
+            gradient_dtype: Element type of ``data``
+            **fields: Remaining GradientUpdate fields
+            
+        Returns:
+            Validated update
+            
+        Raises:
+            ValueError: If the buffer does not hold exactly the elements
+                described by ``gradient_shapes``
+        """
+        buffer = np.frombuffer(data, dtype=gradient_dtype)
+        sizes = [int(np.prod(shape)) for shape in gradient_shapes]
+        if buffer.size != sum(sizes):
+            raise ValueError(
+                f"Buffer holds {buffer.size} elements, gradient_shapes describe {sum(sizes)}"
+            )
+        return cls(
+            gradient_dtype=gradient_dtype,
+            gradient_data=np.split(buffer, np.cumsum(sizes[:-1])),
+            gradient_shapes=gradient_shapes,
+            **fields,
+        )
+    
+    def to_bytes(self) -> bytes:
+        """Get all gradient values as one raw buffer, the inverse of from_bytes."""
+        return self._gradient_buffer.tobytes()
+    
+    def _pack_tensors(self, tensors: List[np.ndarray]) -> None:
+        buffer = np.concatenate(tensors)
+        offsets = np.cumsum([tensor.size for tensor in tensors[:-1]])
+        self.gradient_data = np.split(buffer, offsets)
+        self._gradient_buffer = buffer
+    
+    @property
+    def gradient_buffer(self) -> np.ndarray:
+        """All gradient values as one contiguous array of gradient_dtype."""
+        return self._gradient_buffer
+    
+    def quantize(self, dtype: Literal["float16", "int8"]) -> "GradientUpdate":
+        """
+        Return a copy with gradients reduced to a smaller element type.
+        
+        int8 uses symmetric per-tensor scaling (max |value| maps to 127);
+        the scales are stored in gradient_scales.
+        
+        Args:
+            dtype: Target element type
+            
+        Returns:
+            Quantized copy of this update
+        """
+        tensors = self.dequantize()
+        scales = None
+        if dtype == "int8":
+            scales = []
+            quantized = []
+            for tensor in tensors:
+                peak = float(np.abs(tensor).max()) if tensor.size else 0.0
+                scale = peak / 127 if peak > 0 else 1.0
+                quantized.append(np.round(tensor / scale).astype(np.int8))
+                scales.append(scale)
+        else:
+            quantized = [tensor.astype(dtype) for tensor in tensors]
+        
+        update = self.model_copy(update={
+            "gradient_dtype": dtype,
+            "gradient_scales": scales,
+            "is_compressed": True,
+            "compression_ratio": 4 / np.dtype(dtype).itemsize,
+        })
+        if quantized:
+            update._pack_tensors(quantized)
+        return update
+    
+    def dequantize(self) -> List[np.ndarray]:
+        """Get gradient tensors as float32, undoing any quantization."""
+        if self.gradient_dtype == "float32":
+            return list(self.gradient_data)
+        if self.gradient_dtype == "int8":
+            return [
+                tensor.astype(np.float32) * np.float32(scale)
+                for tensor, scale in zip(self.gradient_data, self.gradient_scales)
+            ]
+        return [tensor.astype(np.float32) for tensor in self.gradient_data]
+    
     def validate_gradient_data(self) -> bool:
         """Validate that gradient data is valid."""
         if not self.gradient_data or not self.gradient_shapes:
@@ -208,24 +535,39 @@ class GradientUpdate(BaseModel):
         if len(self.gradient_data) != len(self.gradient_shapes):
             return False
         
-        # Check for NaN or Inf
-        for tensor in self.gradient_data:
-            if any(not np.isfinite(val) for row in tensor for val in row):
-                return False
+        # Quantized int8 data needs one scale per tensor
+        if self.gradient_dtype == "int8" and (
+            self.gradient_scales is None
+            or len(self.gradient_scales) != len(self.gradient_data)
+        ):
+            return False
+        
+        # Check the buffer holds exactly the declared number of elements
+        # and has no NaN or Inf
+        validator = self.compile_validator(self.gradient_shapes)
+        return validator(self._gradient_buffer)
+    
+    @staticmethod
+    def compile_validator(shapes: List[List[int]]) -> Callable[[np.ndarray], bool]:
+        """
+        Get a cached buffer validator for the given gradient shapes.
         
-        return True
+        Args:
+            shapes: Gradient tensor shapes
+            
+        Returns:
+            Function that checks a flat buffer's size and finiteness
+        """
+        return _shape_validator(tuple(map(tuple, shapes)))
+    
+    @property
+    def num_elements(self) -> int:
+        """Total number of gradient values across all tensors."""
+        return self._gradient_buffer.size
     
     def get_data_size_mb(self) -> float:
         """Calculate size of gradient data in MB."""
-        total_elements = sum(len(row) for tensor in self.gradient_data for row in tensor)
-        # Assuming float32 (4 bytes per element)
-        size_bytes = total_elements * 4
-        return size_bytes / (1024 * 1024)
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
+        return self.num_elements * self._gradient_buffer.itemsize / (1024 * 1024)
 
 
 class AggregatedMetrics(BaseModel):
@@ -267,37 +609,78 @@ class AggregatedMetrics(BaseModel):
     transaction_hash: Optional[str] = Field(None, description="Blockchain tx hash")
     
     # Timestamp
-    timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
-        description="When metrics were aggregated"
+    timestamp_ns: int = Field(
+        default_factory=time.time_ns,
+        description="When metrics were aggregated (epoch nanoseconds)"
     )
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
+    @model_validator(mode="before")
+    @classmethod
+    def _timestamp_to_ns(cls, data: Any) -> Any:
+        # A timestamp= datetime is stored as timestamp_ns rather than dropped
+        return timestamp_input_to_ns(data)
+    
+    @computed_field
+    @property
+    def timestamp(self) -> datetime:
+        """When metrics were aggregated, as a UTC datetime."""
+        return ns_to_datetime(self.timestamp_ns)
 
 
-class MetricsHistory(BaseModel):
-    """Historical metrics storage."""
+@dataclass(slots=True)
+class MetricsHistory:
+    """
+    Historical metrics storage.
     
-    training_metrics: List[TrainingMetrics] = Field(
-        default_factory=list,
-        description="Training metrics history"
-    )
-    network_metrics: List[NetworkMetrics] = Field(
-        default_factory=list,
-        description="Network metrics history"
-    )
-    aggregated_metrics: List[AggregatedMetrics] = Field(
-        default_factory=list,
-        description="Aggregated epoch metrics"
-    )
+    A plain slotted container: the stored metrics are already validated
+    models, so there is nothing left for pydantic to check.
+    
+    Training metrics are indexed by node and epoch as they are added, so
+    add them through add_training_metric rather than appending directly.
+    """
+    
+    training_metrics: List[TrainingMetrics] = field(default_factory=list)
+    network_metrics: List[NetworkMetrics] = field(default_factory=list)
+    aggregated_metrics: List[AggregatedMetrics] = field(default_factory=list)
+    
+    # Positions in training_metrics by node and by epoch
+    _by_node: Dict[str, List[int]] = field(default_factory=dict, init=False, repr=False)
+    _by_epoch: Dict[int, List[int]] = field(default_factory=dict, init=False, repr=False)
+    
+    def __post_init__(self):
+        """Index any training metrics passed in at construction."""
+        for i, metric in enumerate(self.training_metrics):
+            self._index_training_metric(i, metric)
+    
+    def _index_training_metric(self, index: int, metric: TrainingMetrics):
+        self._by_node.setdefault(metric.node_id, []).append(index)
+        self._by_epoch.setdefault(metric.epoch, []).append(index)
     
     def add_training_metric(self, metric: TrainingMetrics):
         """Add training metric to history."""
+        self._index_training_metric(len(self.training_metrics), metric)
         self.training_metrics.append(metric)
     
+    def add_training_metrics_batch(self, records: List[Dict[str, Any]]):
+        """
+        Add a batch of raw training metric records to history.
+        
+        The whole batch is validated in one call through a list TypeAdapter,
+        with the same coercion and constraints as building each record
+        with TrainingMetrics(**record). Nothing is added if any record fails.
+        
+        Args:
+            records: Dicts with TrainingMetrics fields
+            
+        Raises:
+            ValidationError: If any record is missing a field or violates a constraint
+        """
+        metrics = _training_metrics_list_adapter.validate_python(records)
+        start = len(self.training_metrics)
+        for offset, metric in enumerate(metrics):
+            self._index_training_metric(start + offset, metric)
+        self.training_metrics.extend(metrics)
+    
     def add_network_metric(self, metric: NetworkMetrics):
         """Add network metric to history."""
         self.network_metrics.append(metric)
@@ -312,8 +695,10 @@ class MetricsHistory(BaseModel):
     
     def get_metrics_for_node(self, node_id: str) -> List[TrainingMetrics]:
         """Get all metrics for specific node."""
-        return [m for m in self.training_metrics if m.node_id == node_id]
+        metrics = self.training_metrics
+        return [metrics[i] for i in self._by_node.get(node_id, ())]
     
     def get_metrics_for_epoch(self, epoch: int) -> List[TrainingMetrics]:
         """Get all metrics for specific epoch."""
-        return [m for m in self.training_metrics if m.epoch == epoch]
+        metrics = self.training_metrics
+        return [metrics[i] for i in self._by_epoch.get(epoch, ())]
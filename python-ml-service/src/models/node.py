@@ -2,10 +2,15 @@
 Node metadata and status models.
 """
 
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Optional, Dict, Any, Iterable
+from pydantic import BaseModel, Field, computed_field
 from enum import Enum
 from datetime import datetime
+import time
+import numpy as np
+
+from .metrics import calculate_quality_scores
+from .timestamps import ns_to_datetime
 
 
 class NodeStatus(str, Enum):
@@ -19,6 +24,20 @@ class NodeStatus(str, Enum):
     ERROR = "error"
 
 
+_HEALTHY_STATUSES = frozenset({NodeStatus.READY, NodeStatus.TRAINING, NodeStatus.IDLE})
+
+# Clock for heartbeat and update timestamps; a module global so tests can
+# substitute a deterministic one
+_now_ns = time.time_ns
+
+
+def _success_rate(successful_updates: int, total_updates: int) -> float:
+    """Fraction of successful updates, 1.0 when nothing was submitted."""
+    if total_updates == 0:
+        return 1.0
+    return successful_updates / total_updates
+
+
 class NodeMetadata(BaseModel):
     """GPU node metadata and specifications."""
     
@@ -75,16 +94,16 @@ class NodeMetadata(BaseModel):
         description="Assigned data shard index"
     )
     
-    # Timestamps
-    registered_at: datetime = Field(
-        default_factory=datetime.utcnow,
+    # Timestamps (epoch nanoseconds; datetime views are computed below)
+    registered_at_ns: int = Field(
+        default_factory=time.time_ns,
         description="When node was registered"
     )
-    last_heartbeat: datetime = Field(
-        default_factory=datetime.utcnow,
+    last_heartbeat_ns: int = Field(
+        default_factory=time.time_ns,
         description="Last heartbeat timestamp"
     )
-    last_update: Optional[datetime] = Field(
+    last_update_ns: Optional[int] = Field(
         default=None,
         description="Last successful update"
     )
@@ -139,21 +158,41 @@ class NodeMetadata(BaseModel):
         description="Additional custom metadata"
     )
     
+    @computed_field
+    @property
+    def registered_at(self) -> datetime:
+        """When node was registered, as a UTC datetime."""
+        return ns_to_datetime(self.registered_at_ns)
+    
+    @computed_field
+    @property
+    def last_heartbeat(self) -> datetime:
+        """Last heartbeat timestamp, as a UTC datetime."""
+        return ns_to_datetime(self.last_heartbeat_ns)
+    
+    @computed_field
+    @property
+    def last_update(self) -> Optional[datetime]:
+        """Last successful update, as a UTC datetime."""
+        if self.last_update_ns is None:
+            return None
+        return ns_to_datetime(self.last_update_ns)
+    
     def update_heartbeat(self):
         """Update last heartbeat timestamp."""
-        self.last_heartbeat = datetime.utcnow()
+        self.last_heartbeat_ns = _now_ns()
     
     def update_status(self, status: NodeStatus):
         """Update node status."""
         self.status = status
-        self.last_update = datetime.utcnow()
+        self.last_update_ns = _now_ns()
     
     def record_successful_update(self, compute_time: float):
         """Record a successful gradient update."""
         self.successful_updates += 1
         self.total_gradients_submitted += 1
         self.total_compute_time_seconds += compute_time
-        self.last_update = datetime.utcnow()
+        self.last_update_ns = _now_ns()
     
     def record_failed_update(self):
         """Record a failed gradient update."""
@@ -162,13 +201,11 @@ class NodeMetadata(BaseModel):
     
     def calculate_success_rate(self) -> float:
         """Calculate success rate of updates."""
-        if self.total_gradients_submitted == 0:
-            return 1.0
-        return self.successful_updates / self.total_gradients_submitted
+        return _success_rate(self.successful_updates, self.total_gradients_submitted)
     
     def is_healthy(self) -> bool:
         """Check if node is in a healthy state."""
-        return self.status in [NodeStatus.READY, NodeStatus.TRAINING, NodeStatus.IDLE]
+        return self.status in _HEALTHY_STATUSES
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -176,7 +213,12 @@ class NodeMetadata(BaseModel):
 
 
 class NodeRegistry(BaseModel):
-    """Registry of all GPU nodes."""
+    """
+    Registry of all GPU nodes.
+    
+    Active-node queries read each node's current status, so status changes
+    made on the node objects themselves are always reflected.
+    """
     
     nodes: Dict[str, NodeMetadata] = Field(
         default_factory=dict,
@@ -188,6 +230,20 @@ class NodeRegistry(BaseModel):
         self.nodes[node.node_id] = node
         return True
     
+    def register_nodes_bulk(self, nodes: Iterable[NodeMetadata]) -> int:
+        """
+        Register many nodes with a single update of the node map.
+        
+        Args:
+            nodes: Nodes to register; later entries win on duplicate IDs
+            
+        Returns:
+            Number of distinct node IDs registered
+        """
+        batch = {node.node_id: node for node in nodes}
+        self.nodes.update(batch)
+        return len(batch)
+    
     def add_node(self, node: NodeMetadata) -> bool:
         """Add a new node (alias for register_node)."""
         return self.register_node(node)
@@ -195,16 +251,12 @@ class NodeRegistry(BaseModel):
     def update_node(self, node: NodeMetadata) -> bool:
         """Update existing node."""
         if node.node_id in self.nodes:
-            self.nodes[node.node_id] = node
-            return True
+            return self.register_node(node)
         return False
     
     def remove_node(self, node_id: str) -> bool:
         """Remove a node and return success status."""
-        if node_id in self.nodes:
-            del self.nodes[node_id]
-            return True
-        return False
+        return self.nodes.pop(node_id, None) is not None
     
     def get_node(self, node_id: str) -> Optional[NodeMetadata]:
         """Get node metadata by ID."""
@@ -214,9 +266,14 @@ class NodeRegistry(BaseModel):
         """Get list of all nodes."""
         return list(self.nodes.values())
     
+    def _iter_active(self):
+        for node in self.nodes.values():
+            if node.status in _HEALTHY_STATUSES:
+                yield node
+    
     def get_active_nodes(self) -> list[NodeMetadata]:
         """Get list of active (healthy) nodes."""
-        return [node for node in self.nodes.values() if node.is_healthy()]
+        return list(self._iter_active())
     
     def get_nodes_by_status(self, status: NodeStatus) -> list[NodeMetadata]:
         """Get nodes with specific status."""
@@ -224,8 +281,65 @@ class NodeRegistry(BaseModel):
     
     def update_node_status(self, node_id: str, status: NodeStatus):
         """Update status of a specific node."""
-        if node_id in self.nodes:
-            self.nodes[node_id].update_status(status)
+        node = self.nodes.get(node_id)
+        if node is not None:
+            node.update_status(status)
+    
+    def get_node_stats(self) -> np.recarray:
+        """
+        Get per-node counters as a columnar record array.
+        
+        Gathers each column in one pass so fleet-wide statistics (success
+        rates, stale heartbeats, totals) are single NumPy operations rather
+        than loops over NodeMetadata objects.
+        
+        Returns:
+            Record array with ``node_id``, ``status``, ``successful_updates``,
+            ``failed_updates``, ``total_compute_time_seconds``,
+            ``reliability_score``, ``last_heartbeat_ns`` and ``success_rate``
+            fields, one row per registered node
+        """
+        nodes = list(self.nodes.values())
+        count = len(nodes)
+        successful = np.fromiter((n.successful_updates for n in nodes), dtype=np.int64, count=count)
+        total = np.fromiter((n.total_gradients_submitted for n in nodes), dtype=np.int64, count=count)
+        success_rate = np.ones(count)
+        np.divide(successful, total, out=success_rate, where=total > 0)
+        return np.rec.fromarrays(
+            [
+                np.array([n.node_id for n in nodes], dtype=str),
+                np.array([NodeStatus(n.status).value for n in nodes], dtype=str),
+                successful,
+                np.fromiter((n.failed_updates for n in nodes), dtype=np.int64, count=count),
+                np.fromiter((n.total_compute_time_seconds for n in nodes), dtype=np.float64, count=count),
+                np.fromiter((n.reliability_score for n in nodes), dtype=np.float64, count=count),
+                np.fromiter((n.last_heartbeat_ns for n in nodes), dtype=np.int64, count=count),
+                success_rate,
+            ],
+            names=(
+                "node_id,status,successful_updates,failed_updates,"
+                "total_compute_time_seconds,reliability_score,last_heartbeat_ns,success_rate"
+            ),
+        )
+    
+    def compute_all_quality_scores(self) -> np.ndarray:
+        """
+        Compute the network quality score of every node in one pass.
+        
+        Uses each node's average latency and packet loss (0 when not yet
+        measured) and its successful/failed updates as the message counts.
+        
+        Returns:
+            Scores in registration order, aligned with ``get_node_stats()``
+        """
+        nodes = list(self.nodes.values())
+        count = len(nodes)
+        return calculate_quality_scores(
+            np.fromiter((n.average_latency_ms or 0.0 for n in nodes), dtype=np.float64, count=count),
+            np.fromiter((n.packet_loss_rate or 0.0 for n in nodes), dtype=np.float64, count=count),
+            np.fromiter((n.successful_updates for n in nodes), dtype=np.float64, count=count),
+            np.fromiter((n.failed_updates for n in nodes), dtype=np.float64, count=count),
+        )
     
     def count_nodes(self) -> int:
         """Get total number of registered nodes."""
@@ -233,7 +347,8 @@ class NodeRegistry(BaseModel):
     
     def count_active_nodes(self) -> int:
         """Get number of active nodes."""
-        return len(self.get_active_nodes())    
+        return sum(1 for _ in self._iter_active())
+    
     def get_active_count(self) -> int:
         """Alias for count_active_nodes for backward compatibility."""
         return self.count_active_nodes()
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""
+Timestamp helpers shared by the data models.
+
+Models store timestamps as integer epoch nanoseconds from ``time.time_ns``
+and expose datetimes only when read or serialized. Those datetimes are
+timezone-aware UTC, where the models used to hold naive local datetimes:
+consumers comparing them against naive values must attach a timezone.
+A ``timestamp=`` datetime passed to a model is still accepted and stored
+as nanoseconds; naive inputs are taken as local time.
+"""
+
+from typing import Any
+from datetime import datetime, timedelta, timezone
+from pydantic import TypeAdapter
+from pydantic_core import ArgsKwargs
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_datetime_adapter = TypeAdapter(datetime)
+
+
+def ns_to_datetime(timestamp_ns: int) -> datetime:
+    """Convert an epoch-nanosecond timestamp to a UTC datetime."""
+    return datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc)
+
+
+def datetime_to_ns(value: datetime) -> int:
+    """Convert a datetime to epoch nanoseconds; naive datetimes are local time."""
+    if value.tzinfo is None:
+        value = value.astimezone()
+    return (value - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def timestamp_input_to_ns(data: Any, name: str = "timestamp") -> Any:
+    """
+    Map a datetime input ``name`` onto the stored ``{name}_ns`` field.
+    
+    For use in ``mode="before"`` model validators. Dumps carry both the
+    computed datetime and the nanosecond field; the nanosecond field is
+    exact, so it wins when both are given.
+    
+    Args:
+        data: Raw model input (a dict, or ArgsKwargs for dataclass __init__)
+        name: Name of the computed datetime field
+        
+    Returns:
+        The input with ``name`` removed and ``{name}_ns`` filled in
+    """
+    if isinstance(data, ArgsKwargs):
+        if data.kwargs is None or name not in data.kwargs:
+            return data
+        return ArgsKwargs(data.args, timestamp_input_to_ns(data.kwargs, name))
+    if not isinstance(data, dict) or name not in data:
+        return data
+    
+    data = dict(data)
+    value = data.pop(name)
+    ns_name = f"{name}_ns"
+    if value is not None and ns_name not in data:
+        data[ns_name] = datetime_to_ns(_datetime_adapter.validate_python(value))
+    return data
@@ -2,8 +2,36 @@
 Configuration validation utilities to ensure safe settings for demos.
 """
 
+import functools
+
 from src.models.config import TrainingConfig, ModelArchitecture, DatasetType
 
+# Parameter counts for each model
+_MODEL_PARAMS = {
+    ModelArchitecture.SIMPLE_CNN: 20_000,
+    ModelArchitecture.RESNET18: 11_000_000,
+    ModelArchitecture.RESNET50: 25_000_000,
+    ModelArchitecture.VGG16: 138_000_000,
+}
+
+# Base memory per model (MB)
+_BASE_RAM = {
+    ModelArchitecture.SIMPLE_CNN: 5,
+    ModelArchitecture.RESNET18: 200,
+    ModelArchitecture.RESNET50: 500,
+    ModelArchitecture.VGG16: 1500,
+}
+
+# Built once; get_safe_demo_config hands out copies
+_SAFE_DEMO_CONFIG = TrainingConfig(
+    model_architecture=ModelArchitecture.SIMPLE_CNN,
+    dataset=DatasetType.MNIST,
+    epochs=10,
+    batch_size=64,
+    learning_rate=0.01,
+    steps_per_epoch=10
+)
+
 
 def validate_demo_config(config: TrainingConfig, strict: bool = True) -> bool:
     """
@@ -24,14 +52,14 @@ def validate_demo_config(config: TrainingConfig, strict: bool = True) -> bool:
     # Check model architecture
     if config.model_architecture != ModelArchitecture.SIMPLE_CNN:
         issues.append(
-            f"⚠️ Model '{config.model_architecture.value}' may be too heavy for demo. "
+            f"⚠️ Model '{config.model_architecture}' may be too heavy for demo. "
             f"Recommended: SimpleCNN (~20K params)"
         )
     
     # Check dataset
     if config.dataset not in [DatasetType.MNIST, DatasetType.CIFAR10]:
         issues.append(
-            f"⚠️ Dataset '{config.dataset.value}' may be too large. "
+            f"⚠️ Dataset '{config.dataset}' may be too large. "
             f"Recommended: MNIST or CIFAR-10"
         )
     
@@ -75,14 +103,7 @@ def get_safe_demo_config() -> TrainingConfig:
     Returns:
         TrainingConfig: Safe configuration using SimpleCNN and MNIST
     """
-    return TrainingConfig(
-        model_architecture=ModelArchitecture.SIMPLE_CNN,
-        dataset=DatasetType.MNIST,
-        epochs=10,
-        batch_size=64,
-        learning_rate=0.01,
-        steps_per_epoch=10
-    )
+    return _SAFE_DEMO_CONFIG.model_copy()
 
 
 def estimate_resources(config: TrainingConfig, num_nodes: int = 1) -> dict:
@@ -96,24 +117,14 @@ def estimate_resources(config: TrainingConfig, num_nodes: int = 1) -> dict:
     Returns:
         dict: Resource estimates (ram_mb, time_seconds, etc.)
     """
-    # Parameter counts for each model
-    model_params = {
-        ModelArchitecture.SIMPLE_CNN: 20_000,
-        ModelArchitecture.RESNET18: 11_000_000,
-        ModelArchitecture.RESNET50: 25_000_000,
-        ModelArchitecture.VGG16: 138_000_000,
-    }
-    
-    # Base memory per model (MB)
-    base_ram = {
-        ModelArchitecture.SIMPLE_CNN: 5,
-        ModelArchitecture.RESNET18: 200,
-        ModelArchitecture.RESNET50: 500,
-        ModelArchitecture.VGG16: 1500,
-    }
-    
-    params = model_params.get(config.model_architecture, 20_000)
-    ram = base_ram.get(config.model_architecture, 5)
+    return dict(_estimate_resources(config.model_architecture, config.epochs, num_nodes))
+
+
+@functools.lru_cache(maxsize=128)
+def _estimate_resources(model_architecture: str, epochs: int, num_nodes: int) -> dict:
+    """Cached estimate keyed on the only config fields it depends on."""
+    params = _MODEL_PARAMS.get(model_architecture, 20_000)
+    ram = _BASE_RAM.get(model_architecture, 5)
     
     # Estimate total RAM
     coordinator_base = 100  # MB
@@ -124,7 +135,7 @@ def estimate_resources(config: TrainingConfig, num_nodes: int = 1) -> dict:
     # Estimate training time (very rough)
     # SimpleCNN: ~0.3s per epoch, others scale with params
     time_per_epoch = (params / 20_000) * 0.3
-    total_time = time_per_epoch * config.epochs
+    total_time = time_per_epoch * epochs
     
     return {
         "model_parameters": params,
@@ -149,8 +160,8 @@ def print_config_summary(config: TrainingConfig, num_nodes: int = 1):
     print("\n" + "="*60)
     print("📋 Configuration Summary")
     print("="*60)
-    print(f"Model: {config.model_architecture.value}")
-    print(f"Dataset: {config.dataset.value}")
+    print(f"Model: {config.model_architecture}")
+    print(f"Dataset: {config.dataset}")
     print(f"Epochs: {config.epochs}")
     if hasattr(config, 'batch_size'):
         print(f"Batch Size: {config.batch_size}")
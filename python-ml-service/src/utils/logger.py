@@ -12,6 +12,9 @@ import colorama
 # Initialize colorama for Windows color support
 colorama.init()
 
+# Cached so InterceptHandler.emit does not look it up per frame
+_LOGGING_FILE = logging.__file__
+
 
 class InterceptHandler(logging.Handler):
     """
@@ -28,7 +31,7 @@ class InterceptHandler(logging.Handler):
 
         # Find caller from where originated the logged message
         frame, depth = logging.currentframe(), 2
-        while frame.f_code.co_filename == logging.__file__:
+        while frame and frame.f_code.co_filename == _LOGGING_FILE:
             frame = frame.f_back
             depth += 1
 
@@ -42,6 +45,7 @@ def setup_logger(
     log_file: Optional[str] = None,
     rotation: str = "10 MB",
     retention: str = "1 week",
+    enqueue: bool = False,
 ) -> None:
     """
     Set up logging configuration with loguru.
@@ -51,6 +55,8 @@ def setup_logger(
         log_file: Path to log file (None for console only)
         rotation: When to rotate log file
         retention: How long to keep old log files
+        enqueue: Write to sinks from a background worker instead of the
+            logging thread
     """
     # Remove default logger
     logger.remove()
@@ -61,6 +67,7 @@ def setup_logger(
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
         level=log_level,
         colorize=True,
+        enqueue=enqueue,
     )
     
     # Add file logger if specified
@@ -75,10 +82,15 @@ def setup_logger(
             rotation=rotation,
             retention=retention,
             compression="zip",
+            enqueue=enqueue,
         )
     
-    # Intercept standard logging
-    logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
+    # Intercept standard logging, dropping records below log_level before
+    # the stdlib builds and formats them
+    std_level = logging.getLevelName(log_level.upper())
+    if not isinstance(std_level, int):
+        std_level = 0
+    logging.basicConfig(handlers=[InterceptHandler()], level=std_level, force=True)
     
     # Suppress noisy libraries
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -4,52 +4,272 @@ Serialization utilities for tensors and model parameters.
 
 import numpy as np
 import torch
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Iterator, Optional, Union
 import msgpack
 import json
+import base64
+import mmap
+import struct
+import threading
+import zlib
 
+try:
+    import zstandard
+    _zstd_compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+    _zstd_decompressor = zstandard.ZstdDecompressor()
+except ImportError:
+    # Fall back to zlib for compressed payloads
+    zstandard = None
 
-def serialize_tensors(tensors: List[torch.Tensor], use_msgpack: bool = False) -> Dict[str, Any]:
+
+# One-byte dtype codes used in tensor payload metadata and frames
+_DTYPE_CODES = {
+    np.dtype(name): code
+    for code, name in enumerate([
+        "float32", "float64", "float16", "int8", "uint8",
+        "int16", "int32", "int64", "bool",
+    ])
+}
+_CODE_DTYPES = {code: dtype for dtype, code in _DTYPE_CODES.items()}
+
+# Torch dtypes numpy cannot represent, carried as same-width integers
+_VIEW_DTYPES = {
+    torch.bfloat16: torch.int16,
+    torch.float8_e4m3fn: torch.int8,
+    torch.float8_e5m2: torch.int8,
+}
+_VIEW_DTYPE_NAMES = {
+    str(dtype).replace("torch.", ""): (dtype, np.dtype(str(carrier).replace("torch.", "")))
+    for dtype, carrier in _VIEW_DTYPES.items()
+}
+
+# Torch dtype codes: the numpy codes above, then the view-only dtypes
+_TORCH_DTYPE_CODES = {
+    getattr(torch, dtype.name): code for dtype, code in _DTYPE_CODES.items()
+}
+_TORCH_DTYPE_CODES.update({
+    dtype: len(_DTYPE_CODES) + i for i, dtype in enumerate(_VIEW_DTYPES)
+})
+_CODE_TORCH_DTYPES = {code: dtype for dtype, code in _TORCH_DTYPE_CODES.items()}
+# Torch dtypes by name ("float32", "bfloat16", ...) for payloads that name them
+_TORCH_DTYPE_NAMES = {
+    str(dtype).replace("torch.", ""): dtype for dtype in _TORCH_DTYPE_CODES
+}
+# code -> (numpy dtype of the payload bytes, torch dtype to view them as or None)
+_CODE_WIRE_DTYPES = {
+    code: (
+        np.dtype(str(_VIEW_DTYPES.get(dtype, dtype)).replace("torch.", "")),
+        dtype if dtype in _VIEW_DTYPES else None,
+    )
+    for dtype, code in _TORCH_DTYPE_CODES.items()
+}
+
+
+# Pinned host staging buffers for device-to-host copies, one per dtype and
+# grown to the largest call seen. A call checks its buffers out under the
+# lock and hands them back when done, so concurrent calls never share one.
+_pinned_buffers: Dict[torch.dtype, torch.Tensor] = {}
+_copy_streams: Dict[torch.device, Any] = {}
+_staging_lock = threading.Lock()
+
+
+def _torch_dtype(name: str) -> torch.dtype:
+    """Look up a dtype named in a payload; only dtypes in the code tables are accepted."""
+    dtype = _TORCH_DTYPE_NAMES.get(name) if isinstance(name, str) else None
+    if dtype is None:
+        raise ValueError(f"Unsupported tensor dtype: {name!r}")
+    return dtype
+
+
+def _iter_host_arrays(tensors: List[torch.Tensor]) -> Iterator[np.ndarray]:
+    """
+    Yield each tensor as a C-contiguous numpy array on the host.
+    
+    CUDA tensors are all copied into pinned buffers on a side stream up
+    front, without blocking, and each is waited on only when its turn
+    comes, so later transfers overlap with work on earlier tensors. The
+    yielded arrays may be staging buffers: consume each before asking
+    for the next.
+    """
+    if not any(tensor.is_cuda for tensor in tensors):
+        for tensor in tensors:
+            yield tensor.detach().cpu().contiguous().numpy()
+        return
+    
+    tensors = [tensor.detach() for tensor in tensors]
+    needed: Dict[torch.dtype, int] = {}
+    for tensor in tensors:
+        if tensor.is_cuda:
+            needed[tensor.dtype] = needed.get(tensor.dtype, 0) + tensor.numel()
+    
+    with _staging_lock:
+        pinned = {dtype: _pinned_buffers.pop(dtype, None) for dtype in needed}
+        streams = {}
+        for tensor in tensors:
+            if tensor.is_cuda and tensor.device not in streams:
+                stream = _copy_streams.get(tensor.device)
+                if stream is None:
+                    stream = _copy_streams[tensor.device] = torch.cuda.Stream(tensor.device)
+                streams[tensor.device] = stream
+    for dtype, numel in needed.items():
+        if pinned[dtype] is None or pinned[dtype].numel() < numel:
+            pinned[dtype] = torch.empty(numel, dtype=dtype, pin_memory=True)
+    
+    try:
+        staged = []
+        offsets = dict.fromkeys(needed, 0)
+        for tensor in tensors:
+            if not tensor.is_cuda:
+                staged.append((tensor, None))
+                continue
+            
+            offset = offsets[tensor.dtype]
+            offsets[tensor.dtype] = offset + tensor.numel()
+            stream = streams[tensor.device]
+            # Order after the kernels that produced the tensor
+            stream.wait_stream(torch.cuda.current_stream(tensor.device))
+            with torch.cuda.stream(stream):
+                staging = pinned[tensor.dtype][offset:offset + tensor.numel()].view(tensor.shape)
+                staging.copy_(tensor, non_blocking=True)
+                tensor.record_stream(stream)
+                done = torch.cuda.Event()
+                done.record(stream)
+            staged.append((staging, done))
+        
+        for tensor, done in staged:
+            if done is None:
+                yield tensor.cpu().contiguous().numpy()
+            else:
+                done.synchronize()
+                yield tensor.numpy()
+    finally:
+        # Wait for copies still in flight before the buffers can be reused
+        for _, done in staged:
+            if done is not None:
+                done.synchronize()
+        with _staging_lock:
+            for dtype, buffer in pinned.items():
+                current = _pinned_buffers.get(dtype)
+                if current is None or current.numel() < buffer.numel():
+                    _pinned_buffers[dtype] = buffer
+
+
+def serialize_tensors(
+    tensors: List[torch.Tensor],
+    use_msgpack: bool = False,
+    compress: bool = False,
+    transport_dtype: Optional[torch.dtype] = None
+) -> Dict[str, Any]:
     """
     Serialize PyTorch tensors for network transmission.
     
+    Each tensor is packed as its raw C-contiguous bytes (one memcpy) plus
+    shape and dtype, rather than as a list of Python floats. The MessagePack
+    format keeps the payloads binary; the JSON format base64-encodes them.
+    CUDA tensors are staged through pinned host buffers with overlapping
+    asynchronous copies.
+    
+    With ``compress``, the MessagePack binary is compressed with zstd
+    (level 3) when ``zstandard`` is installed, or zlib otherwise.
+    
+    With ``transport_dtype`` (e.g. ``torch.bfloat16``), floating point
+    tensors are cast before they leave the device and cast back to their
+    original dtype by ``deserialize_tensors``. bfloat16 and float8 have
+    no numpy equivalent and travel as same-width integer bytes.
+    
     Args:
         tensors: List of PyTorch tensors
         use_msgpack: Whether to use MessagePack for binary serialization
+        compress: Whether to compress the MessagePack binary
+        transport_dtype: Floating point dtype to send tensors as
         
     Returns:
         Dictionary with serialized data and metadata
     """
     serialized_data = []
     shapes = []
-    dtypes = []
     
-    for tensor in tensors:
-        # Convert to numpy
-        np_array = tensor.detach().cpu().numpy()
+    if transport_dtype is not None:
+        original_codes = bytes(_TORCH_DTYPE_CODES[tensor.dtype] for tensor in tensors)
+        tensors = [
+            tensor.to(transport_dtype) if tensor.is_floating_point() else tensor
+            for tensor in tensors
+        ]
+    
+    # One byte per tensor instead of a dtype name
+    dtype_codes = bytes(_TORCH_DTYPE_CODES[tensor.dtype] for tensor in tensors)
+    host_arrays = _iter_host_arrays([
+        tensor.view(_VIEW_DTYPES[tensor.dtype]) if tensor.dtype in _VIEW_DTYPES else tensor
+        for tensor in tensors
+    ])
+    
+    for np_array in host_arrays:
         shapes.append(list(np_array.shape))
-        dtypes.append(str(np_array.dtype))
         
-        # Flatten and convert to list
-        flat_data = np_array.flatten().tolist()
-        serialized_data.append(flat_data)
+        # Raw bytes, no per-element boxing
+        serialized_data.append(np_array.tobytes())
     
     result = {
         "data": serialized_data,
         "shapes": shapes,
-        "dtypes": dtypes,
+        "dtype_codes": dtype_codes,
         "num_tensors": len(tensors),
     }
+    if transport_dtype is not None:
+        result["original_dtype_codes"] = original_codes
     
     if use_msgpack:
         # Convert to MessagePack binary format
-        return {"binary": msgpack.packb(result), "format": "msgpack"}
+        binary = msgpack.packb(result, use_bin_type=True)
+        if not compress:
+            return {"binary": binary, "format": "msgpack"}
+        if zstandard is not None:
+            return {"binary": _zstd_compressor.compress(binary), "format": "msgpack+zstd"}
+        return {"binary": zlib.compress(binary, 1), "format": "msgpack+zlib"}
     else:
         # Return as JSON-serializable dict
+        result["data"] = [base64.b64encode(data).decode("ascii") for data in serialized_data]
+        result["dtype_codes"] = list(dtype_codes)
+        if transport_dtype is not None:
+            result["original_dtype_codes"] = list(original_codes)
         result["format"] = "json"
         return result
 
 
+def _unpack_msgpack(binary: bytes) -> Dict[str, Any]:
+    """
+    Unpack a MessagePack tensor payload.
+    
+    Arrays come back as tuples rather than lists, which is cheaper to
+    build, and tensor payloads come back as ``bytes`` that are viewed
+    directly by ``np.frombuffer`` without any per-element objects.
+    """
+    return msgpack.unpackb(binary, raw=False, use_list=False)
+
+
+def _payload_wire_dtypes(
+    data_dict: Dict[str, Any],
+    num_tensors: int
+) -> List[Tuple[np.dtype, Optional[torch.dtype]]]:
+    """
+    Per-tensor ``(numpy wire dtype, torch view dtype or None)`` of a payload.
+    
+    Current payloads carry one dtype code per tensor; older ones name each
+    dtype, defaulting to float32.
+    """
+    if "dtype_codes" in data_dict:
+        return [_CODE_WIRE_DTYPES[code] for code in data_dict["dtype_codes"]]
+    
+    wire_dtypes = []
+    for name in data_dict.get("dtypes", ["float32"] * num_tensors):
+        if name in _VIEW_DTYPE_NAMES:
+            view_dtype, np_dtype = _VIEW_DTYPE_NAMES[name]
+            wire_dtypes.append((np_dtype, view_dtype))
+        else:
+            wire_dtypes.append((np.dtype(name), None))
+    return wire_dtypes
+
+
 def deserialize_tensors(
     serialized: Dict[str, Any],
     device: str = "cpu"
@@ -64,27 +284,244 @@ def deserialize_tensors(
     Returns:
         List of PyTorch tensors
     """
-    # Handle MessagePack format
-    if serialized.get("format") == "msgpack":
-        data_dict = msgpack.unpackb(serialized["binary"])
+    # Handle MessagePack format, optionally compressed
+    data_format = serialized.get("format")
+    if data_format == "msgpack+zstd":
+        if zstandard is None:
+            raise ValueError("zstd-compressed payload requires the zstandard package")
+        data_dict = _unpack_msgpack(_zstd_decompressor.decompress(serialized["binary"]))
+    elif data_format == "msgpack+zlib":
+        data_dict = _unpack_msgpack(zlib.decompress(serialized["binary"]))
+    elif data_format == "msgpack":
+        data_dict = _unpack_msgpack(serialized["binary"])
     else:
         data_dict = serialized
     
     tensors = []
     data_list = data_dict["data"]
     shapes = data_dict["shapes"]
-    dtypes = data_dict.get("dtypes", ["float32"] * len(shapes))
+    wire_dtypes = _payload_wire_dtypes(data_dict, len(shapes))
+    original_dtypes = [
+        _CODE_TORCH_DTYPES[code]
+        for code in data_dict.get("original_dtype_codes", ())
+    ] or [None] * len(shapes)
     
-    for data, shape, dtype_str in zip(data_list, shapes, dtypes):
-        # Convert list to numpy array
-        np_array = np.array(data, dtype=dtype_str)
+    for data, shape, (np_dtype, view_dtype), original_dtype in zip(
+        data_list, shapes, wire_dtypes, original_dtypes
+    ):
+        if isinstance(data, str):
+            data = base64.b64decode(data)
+        
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            # View the payload in place
+            np_array = np.frombuffer(data, dtype=np_dtype)
+            if not np_array.flags.writeable:
+                # torch needs writable memory; one copy of the raw bytes
+                np_array = np_array.copy()
+        else:
+            # Older payloads carry a list of values
+            np_array = np.array(data, dtype=np_dtype)
         
         # Reshape
         np_array = np_array.reshape(shape)
         
         # Convert to PyTorch tensor
-        tensor = torch.from_numpy(np_array).to(device)
-        tensors.append(tensor)
+        tensor = torch.from_numpy(np_array)
+        if view_dtype is not None:
+            tensor = tensor.view(view_dtype)
+        if original_dtype is not None:
+            tensor = tensor.to(original_dtype)
+        tensors.append(tensor.to(device))
+    
+    return tensors
+
+
+def serialize_sparse_tensors(
+    sparse: List[Tuple[torch.Tensor, torch.Tensor]],
+    shapes: List[List[int]]
+) -> Dict[str, Any]:
+    """
+    Serialize sparse ``(indices, values)`` pairs, e.g. from top-k compression.
+    
+    All indices go into one contiguous int32 buffer and all values into
+    one raw-bytes buffer, so a payload at compression ratio ``r`` is about
+    ``2 * r`` the size of the dense tensors instead of carrying the zeros.
+    
+    Args:
+        sparse: Per-tensor flat indices and values
+        shapes: Dense shape of each tensor
+        
+    Returns:
+        Dictionary with the two buffers and per-tensor metadata
+    """
+    counts = []
+    index_parts = []
+    value_parts = []
+    
+    # Same dtype codes as the dense format; bfloat16/float8 go as integer bytes
+    dtype_codes = bytes(_TORCH_DTYPE_CODES[values.dtype] for _, values in sparse)
+    for indices, values in sparse:
+        index_parts.append(indices.detach().cpu().numpy().astype(np.int32, copy=False))
+        values = values.detach()
+        if values.dtype in _VIEW_DTYPES:
+            values = values.view(_VIEW_DTYPES[values.dtype])
+        value_array = values.cpu().contiguous().numpy()
+        value_parts.append(value_array.tobytes())
+        counts.append(int(value_array.size))
+    
+    return {
+        "indices": np.concatenate(index_parts).tobytes() if index_parts else b"",
+        "values": b"".join(value_parts),
+        "counts": counts,
+        "shapes": [list(shape) for shape in shapes],
+        "dtype_codes": dtype_codes,
+        "format": "sparse",
+    }
+
+
+def deserialize_sparse_tensors(
+    serialized: Dict[str, Any],
+    device: str = "cpu",
+    dense: bool = True
+) -> List[torch.Tensor]:
+    """
+    Deserialize tensors from ``serialize_sparse_tensors`` output.
+    
+    Args:
+        serialized: Serialized sparse data
+        device: Device to place tensors on (cpu, cuda)
+        dense: Scatter into dense tensors; otherwise return sparse COO
+            tensors for callers that consume them natively
+        
+    Returns:
+        List of PyTorch tensors in their dense shapes
+    """
+    all_indices = torch.from_numpy(
+        np.frombuffer(serialized["indices"], dtype=np.int32).astype(np.int64)
+    )
+    values_buffer = serialized["values"]
+    
+    tensors = []
+    index_start = 0
+    value_offset = 0
+    wire_dtypes = _payload_wire_dtypes(serialized, len(serialized["shapes"]))
+    for count, shape, (np_dtype, view_dtype) in zip(
+        serialized["counts"], serialized["shapes"], wire_dtypes
+    ):
+        values = np.frombuffer(values_buffer, dtype=np_dtype, count=count, offset=value_offset)
+        values = torch.from_numpy(values.copy())
+        if view_dtype is not None:
+            values = values.view(view_dtype)
+        values = values.to(device)
+        indices = all_indices[index_start:index_start + count].to(device)
+        index_start += count
+        value_offset += count * np_dtype.itemsize
+        
+        numel = int(np.prod(shape, dtype=np.int64))
+        if dense:
+            tensor = torch.zeros(numel, dtype=values.dtype, device=device)
+            tensor[indices] = values
+            tensors.append(tensor.reshape(shape))
+        else:
+            coords = (
+                torch.stack(torch.unravel_index(indices, tuple(shape)))
+                if shape else indices.new_zeros((0, count))
+            )
+            tensors.append(torch.sparse_coo_tensor(
+                coords, values, tuple(shape), check_invariants=False
+            ))
+    
+    return tensors
+
+
+# Binary tensor frame layout (all little-endian):
+#   header       magic b"TNSO", version, flags, reserved, num_tensors
+#   descriptors  per tensor: dtype code, ndim, body offset, then ndim dims
+#   bodies       raw C-contiguous tensor bytes, each starting on a
+#                _FRAME_ALIGNMENT boundary from the start of the frame
+_FRAME_MAGIC = b"TNSO"
+_FRAME_VERSION = 1
+_FRAME_ALIGNMENT = 64
+_FRAME_HEADER = struct.Struct("<4sBBHI")
+_FRAME_DESCRIPTOR = struct.Struct("<BBxxxxxxQ")
+
+
+def pack_tensor_frame(tensors: List[torch.Tensor]) -> bytearray:
+    """
+    Pack tensors into a single binary frame with 64-byte aligned bodies.
+    
+    The frame starts with a fixed header and a descriptor per tensor, then
+    each tensor's raw bytes padded to start on a 64-byte boundary. A frame
+    placed at an aligned address (e.g. mmap) gives SIMD-aligned tensor data
+    that ``unpack_tensor_frame`` wraps without parsing.
+    
+    Args:
+        tensors: List of PyTorch tensors
+        
+    Returns:
+        Frame buffer (writable, so unpacking it does not copy)
+    """
+    arrays = list(_iter_host_arrays(tensors))
+    
+    descriptors_size = sum(
+        _FRAME_DESCRIPTOR.size + 8 * array.ndim for array in arrays
+    )
+    offset = _FRAME_HEADER.size + descriptors_size
+    
+    parts = [_FRAME_HEADER.pack(_FRAME_MAGIC, _FRAME_VERSION, 0, 0, len(arrays))]
+    bodies = []
+    for array in arrays:
+        offset += -offset % _FRAME_ALIGNMENT
+        parts.append(_FRAME_DESCRIPTOR.pack(_DTYPE_CODES[array.dtype], array.ndim, offset))
+        parts.append(struct.pack(f"<{array.ndim}Q", *array.shape))
+        bodies.append((offset, array))
+        offset += array.nbytes
+    
+    frame = bytearray(offset)
+    header = b"".join(parts)
+    frame[:len(header)] = header
+    for body_offset, array in bodies:
+        # Copy straight into the frame, no intermediate bytes object
+        body = np.frombuffer(frame, dtype=np.uint8, count=array.nbytes, offset=body_offset)
+        body[:] = array.reshape(-1).view(np.uint8)
+    return frame
+
+
+def unpack_tensor_frame(frame: Any, device: str = "cpu") -> List[torch.Tensor]:
+    """
+    Read tensors back from a frame built by ``pack_tensor_frame``.
+    
+    Tensor data is viewed in place when the frame is writable (bytearray,
+    writable memoryview or mmap); read-only frames are copied per tensor.
+    
+    Args:
+        frame: Frame bytes or buffer
+        device: Device to place tensors on (cpu, cuda)
+        
+    Returns:
+        List of PyTorch tensors
+        
+    Raises:
+        ValueError: If the buffer is not a supported tensor frame
+    """
+    magic, version, _, _, num_tensors = _FRAME_HEADER.unpack_from(frame, 0)
+    if magic != _FRAME_MAGIC or version != _FRAME_VERSION:
+        raise ValueError("Not a tensor frame or unsupported frame version")
+    
+    tensors = []
+    position = _FRAME_HEADER.size
+    for _ in range(num_tensors):
+        code, ndim, body_offset = _FRAME_DESCRIPTOR.unpack_from(frame, position)
+        position += _FRAME_DESCRIPTOR.size
+        shape = struct.unpack_from(f"<{ndim}Q", frame, position)
+        position += 8 * ndim
+        
+        dtype = _CODE_DTYPES[code]
+        count = int(np.prod(shape, dtype=np.int64))
+        np_array = np.frombuffer(frame, dtype=dtype, count=count, offset=body_offset)
+        if not np_array.flags.writeable:
+            np_array = np_array.copy()
+        tensors.append(torch.from_numpy(np_array.reshape(shape)).to(device))
     
     return tensors
 
@@ -117,6 +554,98 @@ def serialize_model_state(
     return state
 
 
+# Flat state dict file layout:
+#   8-byte little-endian index length, JSON index
+#   {name: [offset, shape, dtype]}, then every tensor's raw bytes at
+#   _FRAME_ALIGNMENT-aligned offsets from the start of the data region
+_STATE_INDEX_LENGTH = struct.Struct("<Q")
+
+
+def save_state_dict_flat(model: torch.nn.Module, path: str) -> None:
+    """
+    Save a model's state dict as one flat, memory-mappable file.
+    
+    Each tensor is written as raw bytes to a 64-byte aligned offset and
+    described in a JSON index, so the whole file is written in one pass
+    and ``load_state_dict_flat`` can map it without unpickling.
+    
+    Args:
+        model: PyTorch model
+        path: Output file path
+    """
+    index = {}
+    bodies = []
+    offset = 0
+    for name, tensor in model.state_dict().items():
+        body = tensor.detach().cpu().contiguous().reshape(-1).view(torch.uint8).numpy()
+        offset += -offset % _FRAME_ALIGNMENT
+        index[name] = [offset, list(tensor.shape), str(tensor.dtype).replace("torch.", "")]
+        bodies.append((offset, body))
+        offset += body.nbytes
+    
+    header = json.dumps(index, separators=(",", ":")).encode()
+    header += b" " * (-(_STATE_INDEX_LENGTH.size + len(header)) % _FRAME_ALIGNMENT)
+    data_start = _STATE_INDEX_LENGTH.size + len(header)
+    
+    buffer = bytearray(data_start + offset)
+    buffer[:data_start] = _STATE_INDEX_LENGTH.pack(len(header)) + header
+    view = np.frombuffer(buffer, dtype=np.uint8)
+    for body_offset, body in bodies:
+        start = data_start + body_offset
+        view[start:start + body.nbytes] = body
+    
+    with open(path, "wb") as f:
+        f.write(buffer)
+
+
+def load_state_dict_flat(path: str) -> Dict[str, torch.Tensor]:
+    """
+    Load a state dict written by ``save_state_dict_flat``.
+    
+    The file is memory-mapped copy-on-write and every tensor is a view
+    into the mapping, so loading costs no reads until the data is used
+    and the file on disk is never modified.
+    
+    Args:
+        path: File path
+        
+    Returns:
+        State dict suitable for ``model.load_state_dict``
+        
+    Raises:
+        ValueError: If the index names an unsupported dtype or points
+            outside the file
+    """
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    
+    file_size = len(mapped)
+    if file_size < _STATE_INDEX_LENGTH.size:
+        raise ValueError(f"State file too short: {file_size} bytes")
+    (header_length,) = _STATE_INDEX_LENGTH.unpack_from(mapped, 0)
+    data_start = _STATE_INDEX_LENGTH.size + header_length
+    if data_start > file_size:
+        raise ValueError(f"State index length {header_length} exceeds the file")
+    index = json.loads(mapped[_STATE_INDEX_LENGTH.size:data_start])
+    
+    state_dict = {}
+    for name, (offset, shape, dtype_str) in index.items():
+        dtype = _torch_dtype(dtype_str)
+        count = int(np.prod(shape, dtype=np.int64))
+        start = data_start + offset
+        if offset < 0 or count < 0 or start + count * dtype.itemsize > file_size:
+            raise ValueError(f"Tensor {name!r} lies outside the state file")
+        if count == 0:
+            tensor = torch.empty(shape, dtype=dtype)
+        else:
+            tensor = torch.frombuffer(
+                mapped, dtype=dtype, count=count, offset=start
+            ).reshape(shape)
+        state_dict[name] = tensor
+    
+    return state_dict
+
+
 def deserialize_model_state(
     model: torch.nn.Module,
     state: Dict[str, Any],
@@ -138,36 +667,61 @@ def deserialize_model_state(
         optimizer.load_state_dict(state["optimizer_state_dict"])
 
 
-def tensor_to_json_compatible(tensor: torch.Tensor) -> List[List[float]]:
+def tensor_to_json_compatible(tensor: torch.Tensor) -> Dict[str, Any]:
     """
-    Convert tensor to JSON-compatible nested list.
+    Convert tensor to a JSON-compatible dict.
+    
+    The data is the tensor's raw bytes, base64-encoded, alongside its
+    dtype and shape, so no per-element Python objects are created.
     
     Args:
         tensor: PyTorch tensor
         
     Returns:
-        Nested list representation
+        Dict with ``dtype``, ``shape`` and base64 ``b64`` data
     """
-    np_array = tensor.detach().cpu().numpy()
-    return np_array.tolist()
+    tensor = tensor.detach()
+    dtype_name = str(tensor.dtype).replace("torch.", "")
+    if tensor.dtype in _VIEW_DTYPES:
+        tensor = tensor.view(_VIEW_DTYPES[tensor.dtype])
+    np_array = tensor.cpu().contiguous().numpy()
+    return {
+        "dtype": dtype_name,
+        "shape": list(np_array.shape),
+        "b64": base64.b64encode(np_array.tobytes()).decode("ascii"),
+    }
 
 
 def json_compatible_to_tensor(
-    data: List[List[float]],
+    data: Union[Dict[str, Any], List[Any]],
     device: str = "cpu"
 ) -> torch.Tensor:
     """
-    Convert JSON-compatible nested list to tensor.
+    Convert the output of ``tensor_to_json_compatible`` back to a tensor.
+    
+    Plain nested lists are still accepted.
     
     Args:
-        data: Nested list representation
+        data: JSON-compatible tensor dict or nested list
         device: Device to place tensor on
         
     Returns:
         PyTorch tensor
+        
+    Raises:
+        ValueError: If the dict names a dtype that is not supported
     """
-    np_array = np.array(data)
-    return torch.from_numpy(np_array).to(device)
+    if not isinstance(data, dict):
+        return torch.from_numpy(np.array(data)).to(device)
+    
+    dtype = _torch_dtype(data["dtype"])
+    raw = bytearray(base64.b64decode(data["b64"]))
+    if not raw:
+        return torch.empty(data["shape"], dtype=dtype, device=device)
+    
+    # Straight from the decoded bytes (writable, so no copy) to torch
+    tensor = torch.frombuffer(raw, dtype=dtype).reshape(data["shape"])
+    return tensor.to(device, non_blocking=True)
 
 
 def calculate_tensor_size_mb(tensors: List[torch.Tensor]) -> float:
@@ -180,64 +734,191 @@ def calculate_tensor_size_mb(tensors: List[torch.Tensor]) -> float:
     Returns:
         Size in MB
     """
-    total_bytes = sum(
-        tensor.element_size() * tensor.nelement()
-        for tensor in tensors
-    )
+    total_bytes = sum(tensor.nbytes for tensor in tensors)
     return total_bytes / (1024 * 1024)
 
 
+# Reusable scratch buffers for gradient magnitudes, one per (dtype, device),
+# grown to the largest tensor seen
+_abs_buffers: Dict[Tuple[torch.dtype, torch.device], torch.Tensor] = {}
+
+
+def _abs_into_scratch(flat_grad: torch.Tensor) -> torch.Tensor:
+    """Compute ``flat_grad.abs()`` into a reused buffer (valid until the next call)."""
+    key = (flat_grad.dtype, flat_grad.device)
+    buffer = _abs_buffers.get(key)
+    if buffer is None or buffer.numel() < flat_grad.numel():
+        buffer = _abs_buffers[key] = torch.empty_like(flat_grad)
+    return torch.abs(flat_grad, out=buffer[:flat_grad.numel()])
+
+
 def compress_gradients(
     gradients: List[torch.Tensor],
     method: str = "topk",
-    compression_ratio: float = 0.1
-) -> Tuple[List[torch.Tensor], Dict[str, Any]]:
+    compression_ratio: float = 0.1,
+    error_buffer: Optional[Dict[int, torch.Tensor]] = None,
+    bits: int = 8
+) -> Tuple[List[Any], Dict[str, Any]]:
     """
     Compress gradients for efficient transmission.
     
+    The sparse methods return an ``(indices, values)`` pair per tensor,
+    indexing into the flattened gradient; the original shapes are kept in
+    ``metadata["shapes"]``. ``topk`` selects by an exact ``kthvalue``
+    threshold, ``gaussiank`` estimates the threshold from the mean and
+    standard deviation of the magnitudes (one pass, no selection), so it
+    keeps roughly rather than exactly ``k`` elements.
+    
+    ``quantize`` maps each tensor onto ``bits``-bit codes between its min
+    and max and returns a dict per tensor with the packed code bytes plus
+    the ``scale``, ``zero_point``, ``shape`` and ``dtype`` needed to
+    restore it. ``decompress_gradients`` reverses every method.
+    
+    With ``error_buffer``, compression uses error feedback: the error
+    for tensor ``i`` (dropped or rounded-off mass) is stored under key
+    ``i`` and added back to that tensor's gradient on the next call, so
+    nothing is lost for good. Pass the same dict every step.
+    
     Args:
         gradients: List of gradient tensors
-        method: Compression method (topk, quantize)
+        method: Compression method (topk, gaussiank, quantize)
         compression_ratio: How much to compress (0-1)
+        error_buffer: Per-tensor residuals carried between calls (updated in place)
+        bits: Bits per element for quantize (4 or 8)
         
     Returns:
         Tuple of (compressed_gradients, metadata)
     """
-    if method == "topk":
-        # Keep only top-k elements by magnitude
+    if method in ("topk", "gaussiank"):
+        # Keep only the largest elements by magnitude
         compressed = []
-        metadata = {"method": "topk", "ratio": compression_ratio, "indices": []}
+        metadata = {
+            "method": method,
+            "ratio": compression_ratio,
+            "shapes": [list(grad.shape) for grad in gradients],
+        }
         
-        for grad in gradients:
-            flat_grad = grad.flatten()
-            k = max(1, int(len(flat_grad) * compression_ratio))
+        for i, grad in enumerate(gradients):
+            flat_grad = grad.detach().flatten()
+            if error_buffer is not None:
+                # Fresh tensor, so the residual can be written in place below
+                residual = error_buffer.get(i)
+                flat_grad = flat_grad + residual if residual is not None else flat_grad.clone()
+            absvals = _abs_into_scratch(flat_grad)
             
-            # Get top-k indices
-            _, indices = torch.topk(torch.abs(flat_grad), k)
-            values = flat_grad[indices]
+            if method == "topk":
+                n = flat_grad.numel()
+                k = min(n, max(1, int(n * compression_ratio)))
+                threshold = torch.kthvalue(absvals, n - k + 1).values
+                # Everything above the k-th magnitude, then just enough of
+                # the ties at it to make exactly k (zero-heavy inputs tie a lot)
+                above = (absvals > threshold).nonzero(as_tuple=False).squeeze(1)
+                ties = (absvals == threshold).nonzero(as_tuple=False).squeeze(1)
+                indices = torch.cat((above, ties[: k - above.numel()])).sort().values
+            else:
+                # Values treated as Gaussian: keep both tails beyond
+                # sigma * Phi^-1(1 - ratio / 2), capped at the largest one
+                z = torch.special.ndtri(torch.tensor(1.0 - compression_ratio / 2))
+                threshold = torch.minimum(
+                    flat_grad.mean().abs() + flat_grad.std(correction=0) * z, absvals.max()
+                )
+                indices = (absvals >= threshold).nonzero(as_tuple=False).squeeze(1)
             
-            # Create sparse representation
-            sparse_grad = torch.zeros_like(flat_grad)
-            sparse_grad[indices] = values
+            values = flat_grad[indices]
+            compressed.append((indices, values))
             
-            compressed.append(sparse_grad.reshape(grad.shape))
-            metadata["indices"].append(indices.tolist())
+            if error_buffer is not None:
+                # Residual is what was not sent this step
+                flat_grad[indices] = 0
+                error_buffer[i] = flat_grad
         
         return compressed, metadata
     
     elif method == "quantize":
-        # Quantize to fewer bits
+        # Affine quantization to ``bits`` per element, packed as raw bytes
+        if bits not in (4, 8):
+            raise ValueError(f"Unsupported quantization bits: {bits}")
+        levels = (1 << bits) - 1
         compressed = []
-        metadata = {"method": "quantize", "bits": 8}
+        metadata = {"method": "quantize", "bits": bits, "tensors": []}
         
-        for grad in gradients:
-            # Simple 8-bit quantization
-            grad_min, grad_max = grad.min(), grad.max()
-            scale = (grad_max - grad_min) / 255.0
-            quantized = ((grad - grad_min) / scale).to(torch.uint8)
-            compressed.append(quantized)
+        for i, grad in enumerate(gradients):
+            flat_grad = grad.detach().flatten().float()
+            if error_buffer is not None and i in error_buffer:
+                flat_grad = flat_grad + error_buffer[i]
+            
+            grad_min, grad_max = flat_grad.aminmax()
+            scale = float((grad_max - grad_min) / levels) or 1.0
+            zero_point = float(grad_min)
+            quantized = ((flat_grad - zero_point) / scale).round_().clamp_(0, levels)
+            
+            if error_buffer is not None:
+                error_buffer[i] = flat_grad - (quantized * scale + zero_point)
+            
+            codes = quantized.to(torch.uint8).cpu().numpy()
+            if bits == 4:
+                # Two codes per byte, high nibble first
+                if codes.size % 2:
+                    codes = np.append(codes, np.uint8(0))
+                codes = np.bitwise_or(codes[0::2] << 4, codes[1::2])
+            
+            entry = {
+                "data": codes.tobytes(),
+                "scale": scale,
+                "zero_point": zero_point,
+                "shape": list(grad.shape),
+                "dtype": str(grad.dtype).replace("torch.", ""),
+            }
+            compressed.append(entry)
+            metadata["tensors"].append({k: v for k, v in entry.items() if k != "data"})
         
         return compressed, metadata
     
     else:
         return gradients, {"method": "none"}
+
+
+def decompress_gradients(
+    compressed: List[Any],
+    metadata: Dict[str, Any],
+    device: str = "cpu"
+) -> List[torch.Tensor]:
+    """
+    Rebuild dense gradients from ``compress_gradients`` output.
+    
+    Args:
+        compressed: Compressed gradients
+        metadata: Metadata returned alongside them
+        device: Device to place tensors on (cpu, cuda)
+        
+    Returns:
+        List of gradient tensors in their original shapes
+        
+    Raises:
+        ValueError: If a quantized entry names an unsupported dtype
+    """
+    method = metadata["method"]
+    gradients = []
+    
+    if method in ("topk", "gaussiank"):
+        for (indices, values), shape in zip(compressed, metadata["shapes"]):
+            dense = torch.zeros(int(np.prod(shape)), dtype=values.dtype, device=device)
+            dense[indices.to(device)] = values.to(device)
+            gradients.append(dense.reshape(shape))
+    
+    elif method == "quantize":
+        for entry in compressed:
+            codes = np.frombuffer(entry["data"], dtype=np.uint8)
+            numel = int(np.prod(entry["shape"]))
+            if metadata["bits"] == 4:
+                codes = np.stack([codes >> 4, codes & 0x0F], axis=1).reshape(-1)[:numel]
+            grad = torch.from_numpy(codes.astype(np.float32))
+            grad = grad * entry["scale"] + entry["zero_point"]
+            gradients.append(
+                grad.reshape(entry["shape"]).to(device=device, dtype=_torch_dtype(entry["dtype"]))
+            )
+    
+    else:
+        gradients = [grad.to(device) for grad in compressed]
+    
+    return gradients
@@ -3,12 +3,27 @@ Validation utilities for configuration and data.
 """
 
 from typing import Any, Dict, List
+import functools
+import re
 import torch
 import numpy as np
 from ..models.config import SystemConfig, TrainingConfig
 from ..models.metrics import GradientUpdate
 
 
+# Config keys whose values are redacted before logging (substring match)
+_SENSITIVE_KEY_PATTERN = re.compile(
+    "|".join(["private_key", "password", "secret", "api_key", "token"]),
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _cuda_available() -> bool:
+    """Check CUDA availability once per process."""
+    return torch.cuda.is_available()
+
+
 def validate_config(config: SystemConfig) -> tuple[bool, List[str]]:
     """
     Validate system configuration.
@@ -19,6 +34,12 @@ def validate_config(config: SystemConfig) -> tuple[bool, List[str]]:
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
+    errors = _collect_config_errors(config)
+    return len(errors) == 0, errors
+
+
+def _collect_config_errors(config: SystemConfig) -> List[str]:
+    """Run all configuration checks and return the error messages."""
     errors = []
     
     # Validate training config
@@ -39,7 +60,7 @@ def validate_config(config: SystemConfig) -> tuple[bool, List[str]]:
         errors.append(f"Invalid device: {config.training.device}")
     
     # Check CUDA availability if specified
-    if config.training.device == "cuda" and not torch.cuda.is_available():
+    if config.training.device == "cuda" and not _cuda_available():
         errors.append("CUDA device specified but CUDA is not available")
     
     # Validate network config
@@ -64,7 +85,7 @@ def validate_config(config: SystemConfig) -> tuple[bool, List[str]]:
         if config.blockchain.private_key and len(config.blockchain.private_key) < 10:
             errors.append("Private key appears invalid (too short)")
     
-    return len(errors) == 0, errors
+    return errors
 
 
 def validate_gradient(gradient_update: GradientUpdate) -> tuple[bool, List[str]]:
@@ -93,19 +114,24 @@ def validate_gradient(gradient_update: GradientUpdate) -> tuple[bool, List[str]]
     if len(gradient_update.gradient_data) != len(gradient_update.gradient_shapes):
         errors.append("Number of gradient tensors does not match number of shapes")
     
-    # Check for NaN or Inf values
+    # Check for NaN or Inf values; the tensors are views into one flat
+    # buffer, so scan that once and only locate the bad element on failure
     try:
-        for i, tensor_data in enumerate(gradient_update.gradient_data):
-            for j, row in enumerate(tensor_data):
-                for k, val in enumerate(row):
-                    if not np.isfinite(val):
-                        errors.append(
-                            f"Invalid value (NaN/Inf) in gradient tensor {i} at position [{j},{k}]"
-                        )
-                        break
-                if errors:
-                    break
-            if errors:
+        if not np.isfinite(gradient_update.gradient_buffer).all():
+            shapes = gradient_update.gradient_shapes
+            for i, tensor_data in enumerate(gradient_update.gradient_data):
+                invalid = ~np.isfinite(tensor_data)
+                if not invalid.any():
+                    continue
+                flat_index = int(np.argmax(invalid))
+                if i < len(shapes) and int(np.prod(shapes[i])) == tensor_data.size:
+                    position = np.unravel_index(flat_index, shapes[i])
+                else:
+                    position = (flat_index,)
+                errors.append(
+                    f"Invalid value (NaN/Inf) in gradient tensor {i} at position "
+                    f"[{','.join(str(int(p)) for p in position)}]"
+                )
                 break
     except Exception as e:
         errors.append(f"Error validating gradient data: {str(e)}")
@@ -133,12 +159,17 @@ def validate_gradient(gradient_update: GradientUpdate) -> tuple[bool, List[str]]
     return len(errors) == 0, errors
 
 
-def validate_model_parameters(parameters: Dict[str, torch.Tensor]) -> tuple[bool, List[str]]:
+def validate_model_parameters(
+    parameters: Dict[str, torch.Tensor],
+    fail_fast: bool = False
+) -> tuple[bool, List[str]]:
     """
     Validate model parameters.
     
     Args:
         parameters: Dictionary of parameter tensors
+        fail_fast: Stop at the first invalid parameter instead of
+            reporting all of them
         
     Returns:
         Tuple of (is_valid, list_of_errors)
@@ -150,20 +181,53 @@ def validate_model_parameters(parameters: Dict[str, torch.Tensor]) -> tuple[bool
         return False, errors
     
     for name, param in parameters.items():
-        # Check for NaN or Inf
-        if torch.isnan(param).any():
-            errors.append(f"Parameter '{name}' contains NaN values")
+        if param.numel() == 0:
+            continue
         
-        if torch.isinf(param).any():
-            errors.append(f"Parameter '{name}' contains Inf values")
+        # One pass: NaN propagates into both extremes and an Inf shows up
+        # as one of them, so finite extremes rule out any non-finite value
+        param_min, param_max = torch.aminmax(param.detach())
+        extremes = torch.stack([param_min, param_max]).double()
         
-        # Check if parameter is too large
-        if param.abs().max() > 1e6:
-            errors.append(f"Parameter '{name}' has very large values (max: {param.abs().max():.2e})")
+        if not torch.isfinite(extremes).all():
+            # Slow path only for invalid parameters, to report which kind
+            if torch.isnan(param).any():
+                errors.append(f"Parameter '{name}' contains NaN values")
+            
+            if torch.isinf(param).any():
+                errors.append(f"Parameter '{name}' contains Inf values")
+        else:
+            # Check if parameter is too large
+            abs_max = extremes.abs().max().item()
+            if abs_max > 1e6:
+                errors.append(f"Parameter '{name}' has very large values (max: {abs_max:.2e})")
+        
+        if fail_fast and errors:
+            break
     
     return len(errors) == 0, errors
 
 
+def has_invalid_parameters(parameters: Dict[str, torch.Tensor]) -> bool:
+    """
+    Check whether any parameter contains NaN or Inf values.
+    
+    Stops at the first non-finite parameter; use this when only a yes/no
+    answer is needed rather than the full ``validate_model_parameters``
+    report.
+    
+    Args:
+        parameters: Dictionary of parameter tensors
+        
+    Returns:
+        True if some parameter is not finite
+    """
+    return any(
+        not torch.isfinite(param.detach()).all()
+        for param in parameters.values()
+    )
+
+
 def sanitize_config_for_logging(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Remove sensitive information from config before logging.
@@ -174,12 +238,12 @@ def sanitize_config_for_logging(config: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Sanitized configuration
     """
-    sensitive_keys = ["private_key", "password", "secret", "api_key", "token"]
-    
     def _sanitize_recursive(obj):
         if isinstance(obj, dict):
             return {
-                k: "***REDACTED***" if any(s in k.lower() for s in sensitive_keys) else _sanitize_recursive(v)
+                k: "***REDACTED***"
+                if isinstance(k, str) and _SENSITIVE_KEY_PATTERN.search(k)
+                else _sanitize_recursive(v)
                 for k, v in obj.items()
             }
         elif isinstance(obj, list):
@@ -207,7 +271,7 @@ def check_system_requirements() -> tuple[bool, List[str]]:
     # Check PyTorch
     try:
         import torch
-        if not torch.cuda.is_available():
+        if not _cuda_available():
             warnings.append("CUDA not available, will use CPU (slower)")
     except ImportError:
         warnings.append("PyTorch not installed")
@@ -13,6 +13,12 @@ from src.models.config import SystemConfig, TrainingConfig, NetworkConfig, Block
 from src.models.node import NodeStatus
 
 
+@pytest.fixture(scope="session")
+def base_training_config() -> TrainingConfig:
+    """Default training configuration, built once; derive variants with model_copy."""
+    return TrainingConfig()
+
+
 @pytest.fixture
 def test_config() -> SystemConfig:
     """Create test configuration."""
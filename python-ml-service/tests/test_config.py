@@ -3,7 +3,9 @@ Test configuration system.
 """
 
 import pytest
+import torch
 import json
+import os
 import tempfile
 from pathlib import Path
 from src.models.config import (
@@ -12,7 +14,13 @@ from src.models.config import (
     BlockchainConfig,
     SystemConfig,
 )
-from src.utils.validation import validate_config, check_system_requirements
+from src.utils.validation import (
+    validate_config,
+    check_system_requirements,
+    validate_model_parameters,
+    has_invalid_parameters,
+    sanitize_config_for_logging,
+)
 
 
 class TestConfigValidation:
@@ -55,6 +63,19 @@ class TestConfigValidation:
         is_valid, errors = validate_config(config)
         assert not is_valid
         assert any("packet loss" in err.lower() for err in errors)
+    
+    def test_revalidate_after_change(self):
+        """Test validation tracks changes to the config."""
+        config = SystemConfig()
+        config.training.device = "cpu"
+        assert validate_config(config)[0]
+        
+        config.training.batch_size = 0
+        is_valid, errors = validate_config(config)
+        assert not is_valid
+        
+        config.training.batch_size = 32
+        assert validate_config(config)[0]
 
 
 class TestConfigSerialization:
@@ -85,6 +106,31 @@ class TestConfigSerialization:
             # Clean up
             Path(temp_file).unlink()
     
+    def test_reload_changed_config(self):
+        """Test cached loads return independent copies and pick up file edits."""
+        config = SystemConfig()
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            temp_file = f.name
+            config.to_file(temp_file)
+        
+        try:
+            first = SystemConfig.from_file(temp_file)
+            first.training.epochs = 99
+            second = SystemConfig.from_file(temp_file)
+            assert second.training.epochs == config.training.epochs
+            
+            # Rewrite the file within the same mtime tick (coarse timestamps)
+            mtime_ns = os.stat(temp_file).st_mtime_ns
+            config.training.epochs = 4200
+            config.to_file(temp_file)
+            os.utime(temp_file, ns=(os.stat(temp_file).st_atime_ns, mtime_ns))
+            
+            reloaded = SystemConfig.from_file(temp_file)
+            assert reloaded.training.epochs == 4200
+        finally:
+            Path(temp_file).unlink()
+    
     def test_config_to_dict(self):
         """Test configuration to dictionary conversion."""
         config = TrainingConfig(
@@ -101,6 +147,51 @@ class TestConfigSerialization:
         assert config_dict["epochs"] == 15
 
 
+class TestParameterValidation:
+    """Test model parameter validation."""
+    
+    def test_reports_each_problem(self):
+        """Test NaN, Inf and oversized parameters are all reported."""
+        parameters = {
+            "ok": torch.ones(3),
+            "nan": torch.tensor([1.0, float("nan")]),
+            "inf": torch.tensor([float("-inf"), 1.0]),
+            "big": torch.tensor([-2e6, 1.0]),
+        }
+        is_valid, errors = validate_model_parameters(parameters)
+        assert not is_valid
+        assert errors == [
+            "Parameter 'nan' contains NaN values",
+            "Parameter 'inf' contains Inf values",
+            "Parameter 'big' has very large values (max: 2.00e+06)",
+        ]
+        
+        _, errors = validate_model_parameters(parameters, fail_fast=True)
+        assert errors == ["Parameter 'nan' contains NaN values"]
+    
+    def test_has_invalid_parameters(self):
+        """Test the boolean fast path."""
+        assert not has_invalid_parameters({"w": torch.ones(3), "b": torch.zeros(0)})
+        assert has_invalid_parameters({"w": torch.ones(3), "b": torch.tensor([float("inf")])})
+
+
+class TestSanitizeConfig:
+    """Test config sanitization for logging."""
+    
+    def test_redacts_sensitive_keys_at_any_depth(self):
+        """Test sensitive keys are redacted case-insensitively in nested data."""
+        config = {
+            "blockchain": {"Private_Key": "0xabc", "rpc_url": "http://localhost"},
+            "API_KEY": "key",
+            "nodes": [{"auth_token": "t", "node_id": "n1"}],
+        }
+        assert sanitize_config_for_logging(config) == {
+            "blockchain": {"Private_Key": "***REDACTED***", "rpc_url": "http://localhost"},
+            "API_KEY": "***REDACTED***",
+            "nodes": [{"auth_token": "***REDACTED***", "node_id": "n1"}],
+        }
+
+
 class TestSystemRequirements:
     """Test system requirements checking."""
     
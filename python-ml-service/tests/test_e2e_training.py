@@ -5,7 +5,6 @@ Comprehensive tests for complete training workflow with all adaptive features.
 """
 
 import pytest
-import asyncio
 import time
 from typing import Dict, List, Any
 from pathlib import Path
@@ -13,20 +12,35 @@ import json
 
 from src.models.config import SystemConfig, TrainingConfig, BlockchainConfig, NetworkConfig
 from src.core.coordinator import TrainingCoordinator
-from src.core.gpu_node import GPUNode
-from src.core.adaptive_orchestrator import AdaptiveOrchestrator
-from src.models.node import NodeMetadata
+from src.models.node import NodeMetadata, NodeStatus
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Log banners
+_BAR = "=" * 80
+_SEP = f"\n{_BAR}"
+
+# Node IDs for the largest registry any test builds (scalability: 50)
+NODE_IDS = tuple(f"node_{i+1}" for i in range(50))
+
+
+def make_node(i: int, **fields: Any) -> NodeMetadata:
+    """Build ready test node ``i`` on its own loopback port."""
+    return NodeMetadata(
+        node_id=NODE_IDS[i],
+        node_address=f"127.0.0.1:{50051 + i}",
+        status=NodeStatus.READY,
+        **fields
+    )
+
 
 class TestEndToEndTraining:
     """End-to-end training workflow tests."""
     
-    @pytest.fixture
-    def test_config(self) -> SystemConfig:
-        """Create test configuration."""
+    @pytest.fixture(scope="class")
+    def base_config(self) -> SystemConfig:
+        """Build the shared test configuration once; never mutate it."""
         return SystemConfig(
             training=TrainingConfig(
                 model_name="simple_cnn",
@@ -47,13 +61,17 @@ class TestEndToEndTraining:
             )
         )
     
+    @pytest.fixture
+    def test_config(self, base_config: SystemConfig) -> SystemConfig:
+        """Create a per-test copy of the configuration that tests may modify."""
+        return base_config.model_copy(deep=True)
+    
     @pytest.fixture
     def coordinator(self, test_config: SystemConfig) -> TrainingCoordinator:
         """Create coordinator instance."""
         return TrainingCoordinator(test_config)
     
-    @pytest.mark.asyncio
-    async def test_basic_training_workflow(self, coordinator: TrainingCoordinator, test_config: SystemConfig):
+    def test_basic_training_workflow(self, coordinator: TrainingCoordinator, test_config: SystemConfig):
         """
         Test basic training workflow with 5 nodes.
         
@@ -64,9 +82,9 @@ class TestEndToEndTraining:
         - Model accuracy improves
         - Metrics are collected
         """
-        logger.info("\n" + "="*80)
+        logger.info(_SEP)
         logger.info("TEST: Basic Training Workflow")
-        logger.info("="*80)
+        logger.info(_BAR)
         
         # Step 1: Initialize training
         logger.info("[Step 1/6] Initializing training...")
@@ -78,41 +96,29 @@ class TestEndToEndTraining:
         logger.info("[Step 2/6] Registering 5 GPU nodes...")
         nodes = []
         for i in range(5):
-            node = GPUNode(
-                node_id=f"node_{i+1}",
-                config=test_config,
-                coordinator_address="localhost:8000"
-            )
-            nodes.append(node)
+            node_metadata = make_node(i)
+            nodes.append(node_metadata)
             
             # Register with coordinator
-            node_metadata = NodeMetadata(
-                node_id=node.node_id,
-                status="active",
-                capabilities={"gpu_memory": 8192, "compute_capability": "7.5"}
-            )
             coordinator.node_registry.register_node(node_metadata)
         
-        assert len(coordinator.node_registry.nodes) == 5, "Not all nodes registered"
+        assert coordinator.node_registry.count_nodes() == 5, "Not all nodes registered"
         logger.info(f"✓ {len(nodes)} nodes registered")
         
         # Step 3: Start training
         logger.info("[Step 3/6] Starting training for 3 epochs...")
         start_time = time.time()
         
-        # Simulate training loop
-        for epoch in range(test_config.training.epochs):
-            logger.info(f"\nEpoch {epoch + 1}/{test_config.training.epochs}")
+        # Simulate training loop; no gradients are exchanged here, so each
+        # epoch just advances to its last step
+        epochs = test_config.training.epochs
+        batch_size = test_config.training.batch_size
+        steps_per_epoch = max(1, 100 // batch_size)
+        for epoch in range(epochs):
+            logger.info(f"\nEpoch {epoch + 1}/{epochs}")
             coordinator.current_epoch = epoch + 1
+            coordinator.current_step = steps_per_epoch
             
-            # Simulate steps per epoch
-            steps_per_epoch = 100 // test_config.training.batch_size
-            for step in range(steps_per_epoch):
-                coordinator.current_step = step + 1
-                
-                # Simulate gradient collection from nodes
-                # In real system, nodes would send gradients
-                
             # Check progress
             assert coordinator.current_epoch == epoch + 1
             logger.info(f"✓ Epoch {epoch + 1} completed")
@@ -127,26 +133,24 @@ class TestEndToEndTraining:
         
         # Step 5: Verify all nodes participated
         logger.info("[Step 5/6] Verifying node participation...")
-        active_nodes = sum(1 for node in coordinator.node_registry.nodes.values() 
-                          if node.status == "active")
+        active_nodes = coordinator.node_registry.count_active_nodes()
         assert active_nodes == 5, f"Expected 5 active nodes, got {active_nodes}"
         logger.info(f"✓ All {active_nodes} nodes participated")
         
         # Step 6: Verify training completed successfully
         logger.info("[Step 6/6] Verifying training completion...")
-        assert coordinator.current_epoch == test_config.training.epochs
+        assert coordinator.current_epoch == epochs
         logger.info("✓ Training workflow completed successfully")
         
         # Print summary
-        logger.info("\n" + "="*80)
+        logger.info(_SEP)
         logger.info("TEST PASSED: Basic Training Workflow")
         logger.info(f"  - Epochs completed: {coordinator.current_epoch}")
         logger.info(f"  - Nodes participated: {len(nodes)}")
         logger.info(f"  - Training time: {training_time:.2f}s")
-        logger.info("="*80)
+        logger.info(_BAR)
     
-    @pytest.mark.asyncio
-    async def test_adaptive_training_workflow(self, coordinator: TrainingCoordinator, test_config: SystemConfig):
+    def test_adaptive_training_workflow(self, coordinator: TrainingCoordinator, test_config: SystemConfig):
         """
         Test training with adaptive features enabled.
         
@@ -156,15 +160,16 @@ class TestEndToEndTraining:
         - Poor performing nodes are identified
         - Training adapts dynamically
         """
-        logger.info("\n" + "="*80)
+        logger.info(_SEP)
         logger.info("TEST: Adaptive Training Workflow")
-        logger.info("="*80)
+        logger.info(_BAR)
         
         # Enable network simulation with varying conditions
         test_config.network.simulation_enabled = True
         
         # Step 1: Initialize with adaptive orchestrator
         logger.info("[Step 1/5] Initializing adaptive training...")
+        from src.core.adaptive_orchestrator import AdaptiveOrchestrator
         orchestrator = AdaptiveOrchestrator(coordinator, test_config)
         
         success = coordinator.initialize_training()
@@ -182,11 +187,7 @@ class TestEndToEndTraining:
         ]
         
         for i, profile in enumerate(network_profiles):
-            node_metadata = NodeMetadata(
-                node_id=f"node_{i+1}",
-                status="active",
-                capabilities={"gpu_memory": 8192, "network_profile": profile}
-            )
+            node_metadata = make_node(i, network_profile=profile["quality"])
             coordinator.node_registry.register_node(node_metadata)
         
         logger.info(f"✓ {len(network_profiles)} nodes registered with varying profiles")
@@ -213,12 +214,11 @@ class TestEndToEndTraining:
         # In full implementation, would compare training time and convergence
         logger.info("✓ Adaptive training shows improvement")
         
-        logger.info("\n" + "="*80)
+        logger.info(_SEP)
         logger.info("TEST PASSED: Adaptive Training Workflow")
-        logger.info("="*80)
+        logger.info(_BAR)
     
-    @pytest.mark.asyncio
-    async def test_blockchain_integration_workflow(self, test_config: SystemConfig):
+    def test_blockchain_integration_workflow(self, test_config: SystemConfig):
         """
         Test training workflow with blockchain recording.
         
@@ -227,9 +227,9 @@ class TestEndToEndTraining:
         - Contributions recorded per epoch
         - Rewards calculated correctly
         """
-        logger.info("\n" + "="*80)
+        logger.info(_SEP)
         logger.info("TEST: Blockchain Integration Workflow")
-        logger.info("="*80)
+        logger.info(_BAR)
         
         # Enable blockchain (will skip if not configured)
         test_config.blockchain.enabled = True
@@ -259,74 +259,55 @@ class TestEndToEndTraining:
         # rewards = coordinator.blockchain_integrator.calculate_rewards(...)
         logger.info("✓ Rewards calculated")
         
-        logger.info("\n" + "="*80)
+        logger.info(_SEP)
         logger.info("TEST PASSED: Blockchain Integration Workflow")
-        logger.info("="*80)
+        logger.info(_BAR)
     
-    @pytest.mark.asyncio
-    async def test_scalability_workflow(self, coordinator: TrainingCoordinator, test_config: SystemConfig):
+    @pytest.mark.parametrize("num_nodes", [10, 20, 50])
+    def test_scalability_workflow(
+        self,
+        coordinator: TrainingCoordinator,
+        test_config: SystemConfig,
+        num_nodes: int
+    ):
         """
-        Test training scalability with increasing number of nodes.
+        Test training scalability at a given number of nodes.
         
         Expected behavior:
         - System handles 10, 20, 50 nodes
         - Performance scales reasonably
         - No crashes or deadlocks
         """
-        logger.info("\n" + "="*80)
-        logger.info("TEST: Scalability Workflow")
-        logger.info("="*80)
+        logger.info(_SEP)
+        logger.info(f"TEST: Scalability Workflow ({num_nodes} nodes)")
+        logger.info(_BAR)
         
-        node_counts = [10, 20, 50]
-        results = []
+        start_ns = time.perf_counter_ns()
         
-        for num_nodes in node_counts:
-            logger.info(f"\n[Test {node_counts.index(num_nodes) + 1}/3] Testing with {num_nodes} nodes...")
-            
-            # Reset coordinator
-            coordinator.node_registry.nodes.clear()
-            
-            # Register nodes
-            start_time = time.time()
-            for i in range(num_nodes):
-                node_metadata = NodeMetadata(
-                    node_id=f"node_{i+1}",
-                    status="active",
-                    capabilities={"gpu_memory": 8192}
-                )
-                coordinator.node_registry.register_node(node_metadata)
-            
-            # Simulate one epoch
-            coordinator.current_epoch = 1
-            
-            elapsed = time.time() - start_time
-            results.append({
-                "num_nodes": num_nodes,
-                "time": elapsed,
-                "success": True
-            })
-            
-            logger.info(f"✓ {num_nodes} nodes: {elapsed:.2f}s")
+        coordinator.node_registry.register_nodes_bulk(
+            make_node(i) for i in range(num_nodes)
+        )
+        assert coordinator.node_registry.count_nodes() == num_nodes
+        
+        # Simulate one epoch
+        coordinator.current_epoch = 1
         
-        # Verify reasonable scaling
-        logger.info("\nScaling Results:")
-        for result in results:
-            logger.info(f"  - {result['num_nodes']} nodes: {result['time']:.2f}s")
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        logger.info(f"✓ {num_nodes} nodes: {elapsed_ns / 1e9:.2f}s")
         
-        logger.info("\n" + "="*80)
+        logger.info(_SEP)
         logger.info("TEST PASSED: Scalability Workflow")
-        logger.info("="*80)
+        logger.info(_BAR)
 
 
 class TestTrainingMetrics:
     """Test training metrics collection and accuracy."""
     
-    @pytest.mark.asyncio
-    async def test_metrics_collection(self, test_config: SystemConfig):
+    def test_metrics_collection(self, test_config: SystemConfig):
         """Test that metrics are collected correctly during training."""
-        logger.info("\n" + "="*80)
+        logger.info(_SEP)
         logger.info("TEST: Metrics Collection")
-        logger.info("="*80)
+        logger.info(_BAR)
         
         coordinator = TrainingCoordinator(test_config)
         coordinator.initialize_training()
@@ -340,14 +321,13 @@ class TestTrainingMetrics:
             pass
         
         logger.info("✓ Metrics collection verified")
-        logger.info("="*80)
+        logger.info(_BAR)
     
-    @pytest.mark.asyncio
-    async def test_metrics_accuracy(self):
+    def test_metrics_accuracy(self):
         """Test that metrics calculations are mathematically correct."""
-        logger.info("\n" + "="*80)
+        logger.info(_SEP)
         logger.info("TEST: Metrics Accuracy")
-        logger.info("="*80)
+        logger.info(_BAR)
         
         # Test various metric calculations
         # - Average loss
@@ -355,14 +335,14 @@ class TestTrainingMetrics:
         # - Throughput
         
         logger.info("✓ Metrics accuracy verified")
-        logger.info("="*80)
+        logger.info(_BAR)
 
 
 def run_all_e2e_tests():
     """Run all end-to-end tests."""
-    logger.info("\n" + "="*80)
+    logger.info(_SEP)
     logger.info("RUNNING ALL END-TO-END TESTS")
-    logger.info("="*80 + "\n")
+    logger.info(f"{_BAR}\n")
     
     # Run with pytest
     pytest.main([__file__, "-v", "-s"])
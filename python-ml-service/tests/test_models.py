@@ -2,9 +2,13 @@
 Tests for data models and configuration.
 """
 
+import array
+import copy
 import pytest
 import json
-from datetime import datetime
+import numpy as np
+from pydantic import ValidationError
+from datetime import datetime, timezone
 from pathlib import Path
 from src.models.config import (
     TrainingConfig,
@@ -15,16 +19,35 @@ from src.models.config import (
     ModelArchitecture,
 )
 from src.models.node import NodeMetadata, NodeStatus, NodeRegistry
-from src.models.metrics import TrainingMetrics, NetworkMetrics, GradientUpdate
-from src.models.blockchain import BlockchainContribution, SessionContributions
+from src.models.metrics import (
+    TrainingMetrics,
+    NetworkMetrics,
+    AggregatedMetrics,
+    GradientUpdate,
+    MetricsHistory,
+    calculate_quality_scores,
+    _FINITE_CHECK_CHUNK,
+    _all_finite,
+    to_json,
+)
+from src.utils.validation import validate_gradient
+from src.models.blockchain import (
+    BlockchainContribution,
+    SessionContributions,
+    RewardDistribution,
+    load_contributions_json,
+)
+
+# Success rate of 2 successful updates out of 3, computed exactly as the model does
+TWO_THIRDS = 2 / 3
 
 
 class TestTrainingConfig:
     """Test TrainingConfig model."""
     
-    def test_default_config(self):
+    def test_default_config(self, base_training_config):
         """Test default configuration values."""
-        config = TrainingConfig()
+        config = base_training_config
         assert config.model_architecture == ModelArchitecture.SIMPLE_CNN
         assert config.dataset == DatasetType.MNIST
         assert config.learning_rate == 0.001
@@ -32,16 +55,16 @@ class TestTrainingConfig:
         assert config.epochs == 10
         assert config.num_nodes == 5
     
-    def test_custom_config(self):
+    def test_custom_config(self, base_training_config):
         """Test custom configuration."""
-        config = TrainingConfig(
-            model_architecture=ModelArchitecture.RESNET18,
-            dataset=DatasetType.CIFAR10,
-            learning_rate=0.01,
-            batch_size=128,
-            epochs=20,
-            num_nodes=10,
-        )
+        config = base_training_config.model_copy(update={
+            "model_architecture": ModelArchitecture.RESNET18,
+            "dataset": DatasetType.CIFAR10,
+            "learning_rate": 0.01,
+            "batch_size": 128,
+            "epochs": 20,
+            "num_nodes": 10,
+        })
         assert config.model_architecture == ModelArchitecture.RESNET18
         assert config.dataset == DatasetType.CIFAR10
         assert config.learning_rate == 0.01
@@ -59,23 +82,34 @@ class TestTrainingConfig:
         with pytest.raises(ValueError):
             TrainingConfig(batch_size=-1)
     
-    def test_serialization(self):
-        """Test config serialization to/from JSON."""
+    def test_model_dump_shape(self):
+        """Test config serializes to a dict of its field values."""
         config = TrainingConfig(
             learning_rate=0.01,
             batch_size=32,
             epochs=5,
         )
         
-        # To dict
         config_dict = config.model_dump()
+        assert config_dict.keys() == TrainingConfig.model_fields.keys()
         assert config_dict["learning_rate"] == 0.01
         assert config_dict["batch_size"] == 32
+        assert config_dict["epochs"] == 5
+    
+    def test_roundtrip_equality(self):
+        """Test config survives a dump/load round trip unchanged."""
+        config = TrainingConfig(
+            learning_rate=0.01,
+            batch_size=32,
+            epochs=5,
+        )
+        
+        config2 = TrainingConfig(**config.model_dump())
+        assert config2.__dict__ == config.__dict__
         
-        # From dict
-        config2 = TrainingConfig(**config_dict)
-        assert config2.learning_rate == config.learning_rate
-        assert config2.batch_size == config.batch_size
+        # Through JSON, encoded and parsed in pydantic-core
+        config3 = TrainingConfig.model_validate_json(config.model_dump_json())
+        assert config3.__dict__ == config.__dict__
 
 
 class TestNodeMetadata:
@@ -93,13 +127,13 @@ class TestNodeMetadata:
         assert node.status == NodeStatus.INITIALIZING
         assert node.gpu_memory_gb == 40.0
     
-    def test_update_heartbeat(self):
+    def test_update_heartbeat(self, monkeypatch):
         """Test heartbeat update."""
         node = NodeMetadata(node_id="node-1", node_address="localhost:50051")
         old_heartbeat = node.last_heartbeat
         
-        import time
-        time.sleep(0.01)
+        later_ns = node.last_heartbeat_ns + 10_000_000
+        monkeypatch.setattr("src.models.node._now_ns", lambda: later_ns)
         node.update_heartbeat()
         
         assert node.last_heartbeat > old_heartbeat
@@ -133,7 +167,7 @@ class TestNodeMetadata:
         node.record_failed_update()
         
         # 2 successful out of 3 total
-        assert node.calculate_success_rate() == pytest.approx(2/3)
+        assert node.calculate_success_rate() == TWO_THIRDS
     
     def test_is_healthy(self):
         """Test health check."""
@@ -183,13 +217,14 @@ class TestNodeRegistry:
         registry = NodeRegistry()
         
         # Add healthy nodes
-        for i in range(3):
-            node = NodeMetadata(
+        registry.register_nodes_bulk([
+            NodeMetadata(
                 node_id=f"node-{i}",
                 node_address=f"localhost:5005{i}",
                 status=NodeStatus.READY,
             )
-            registry.register_node(node)
+            for i in range(3)
+        ])
         
         # Add unhealthy node
         bad_node = NodeMetadata(
@@ -202,6 +237,140 @@ class TestNodeRegistry:
         active = registry.get_active_nodes()
         assert len(active) == 3
         assert all(node.is_healthy() for node in active)
+        assert registry.get_nodes_by_status(NodeStatus.ERROR) == [bad_node]
+        
+        # Removed nodes drop out; recovered nodes rejoin
+        registry.remove_node("node-0")
+        registry.update_node_status("node-bad", NodeStatus.IDLE)
+        assert [n.node_id for n in registry.get_active_nodes()] == ["node-1", "node-2", "node-bad"]
+        assert registry.get_nodes_by_status(NodeStatus.ERROR) == []
+        assert [n.node_id for n in registry.get_nodes_by_status(NodeStatus.READY)] == ["node-1", "node-2"]
+    
+    def test_copied_node_does_not_touch_registry(self):
+        """Test status changes on a copy of a registered node leave the registry alone."""
+        registry = NodeRegistry()
+        node = NodeMetadata(
+            node_id="node-1", node_address="localhost:50051", status=NodeStatus.READY
+        )
+        registry.register_node(node)
+        
+        snapshot = node.model_copy()
+        snapshot.status = NodeStatus.OFFLINE
+        
+        assert registry.get_active_nodes() == [node]
+        assert registry.count_active_nodes() == 1
+        assert registry.get_nodes_by_status(NodeStatus.READY) == [node]
+        assert registry.get_nodes_by_status(NodeStatus.OFFLINE) == []
+    
+    def test_register_nodes_bulk(self):
+        """Test bulk registration matches one-by-one registration."""
+        registry = NodeRegistry()
+        registry.register_node(NodeMetadata(
+            node_id="node-0", node_address="localhost:50050", status=NodeStatus.ERROR
+        ))
+        
+        count = registry.register_nodes_bulk(
+            NodeMetadata(
+                node_id=f"node-{i}",
+                node_address=f"localhost:5005{i}",
+                status=NodeStatus.READY,
+            )
+            for i in range(4)
+        )
+        
+        assert count == 4
+        assert registry.count_nodes() == 4
+        assert registry.count_active_nodes() == 4
+        registry.nodes["node-2"].status = NodeStatus.OFFLINE
+        assert registry.count_active_nodes() == 3
+    
+    @pytest.mark.slow
+    def test_register_nodes_bulk_matches_one_by_one(self):
+        """Test bulk registration of 10k nodes matches registering them singly."""
+        nodes = [
+            NodeMetadata(
+                node_id=f"node-{i}",
+                node_address=f"10.0.{i // 256}.{i % 256}:50051",
+                status=NodeStatus.READY if i % 3 else NodeStatus.OFFLINE,
+            )
+            for i in range(10_000)
+        ]
+        one_by_one = NodeRegistry()
+        for node in nodes:
+            one_by_one.register_node(node.model_copy())
+        
+        bulk = NodeRegistry()
+        assert bulk.register_nodes_bulk(nodes) == 10_000
+        
+        assert list(bulk.nodes) == list(one_by_one.nodes)
+        assert [n.node_id for n in bulk.get_active_nodes()] == [
+            n.node_id for n in one_by_one.get_active_nodes()
+        ]
+    
+    def test_active_nodes_follow_status_changes(self):
+        """Test active nodes track status changes and removals."""
+        registry = NodeRegistry()
+        for i in range(3):
+            registry.register_node(NodeMetadata(
+                node_id=f"node-{i}",
+                node_address=f"localhost:5005{i}",
+                status=NodeStatus.READY,
+            ))
+        
+        registry.nodes["node-1"].status = NodeStatus.OFFLINE
+        assert [n.node_id for n in registry.get_active_nodes()] == ["node-0", "node-2"]
+        assert registry.count_active_nodes() == 2
+        
+        registry.update_node_status("node-1", NodeStatus.TRAINING)
+        registry.remove_node("node-0")
+        assert registry.count_active_nodes() == 2
+        assert {n.node_id for n in registry.get_active_nodes()} == {"node-1", "node-2"}
+        
+        restored = NodeRegistry(**registry.model_dump())
+        assert restored.count_active_nodes() == 2
+    
+    def test_node_becomes_active_outside_registry(self):
+        """Test nodes that turn healthy on their own, or are stored directly, count as active."""
+        registry = NodeRegistry()
+        node = NodeMetadata(node_id="node-1", node_address="localhost:50051")
+        registry.register_node(node)
+        assert node.status == NodeStatus.INITIALIZING
+        assert registry.count_active_nodes() == 0
+        
+        node.update_status(NodeStatus.READY)
+        assert node.is_healthy()
+        assert registry.count_active_nodes() == 1
+        assert registry.get_active_nodes() == [node]
+        
+        registry.nodes["node-2"] = NodeMetadata(
+            node_id="node-2", node_address="localhost:50052", status=NodeStatus.IDLE
+        )
+        assert [n.node_id for n in registry.get_active_nodes()] == ["node-1", "node-2"]
+    
+    def test_get_node_stats(self):
+        """Test columnar node statistics."""
+        registry = NodeRegistry()
+        for i in range(3):
+            registry.register_node(NodeMetadata(
+                node_id=f"node-{i}",
+                node_address=f"localhost:5005{i}",
+                status=NodeStatus.READY,
+            ))
+        registry.nodes["node-1"].record_successful_update(2.0)
+        registry.nodes["node-1"].record_failed_update()
+        registry.nodes["node-2"].status = "offline"
+        
+        stats = registry.get_node_stats()
+        assert list(stats.node_id) == ["node-0", "node-1", "node-2"]
+        assert list(stats.status) == ["ready", "ready", "offline"]
+        assert list(stats.success_rate) == [1.0, 0.5, 1.0]
+        assert stats.total_compute_time_seconds.sum() == 2.0
+        assert len(NodeRegistry().get_node_stats()) == 0
+        
+        scores = registry.compute_all_quality_scores()
+        assert scores.shape == (3,)
+        assert scores[0] == pytest.approx(1.0)
+        assert scores[1] == pytest.approx(0.85)
 
 
 class TestTrainingMetrics:
@@ -224,7 +393,119 @@ class TestTrainingMetrics:
         assert metrics.node_id == "node-1"
         assert metrics.loss == 0.5
         assert metrics.accuracy == 0.85
+        assert isinstance(metrics.timestamp_ns, int)
         assert isinstance(metrics.timestamp, datetime)
+        
+        with pytest.raises(ValidationError):
+            metrics.loss = 0.1
+    
+    def test_to_json(self):
+        """Test JSON bytes encoding of models nested in plain data."""
+        metrics = TrainingMetrics(
+            node_id="node-1",
+            epoch=1,
+            step=10,
+            loss=0.5,
+            samples_processed=64,
+            time_taken_seconds=2.5,
+            samples_per_second=25.6,
+        )
+        
+        data = json.loads(to_json({"type": "metrics_update", "metrics": metrics}))
+        assert data["metrics"]["node_id"] == "node-1"
+        assert data["metrics"]["timestamp"] == metrics.timestamp.isoformat().replace("+00:00", "Z")
+    
+    def test_timestamp_keyword_kept(self):
+        """Test a timestamp= datetime is stored rather than silently replaced."""
+        recorded = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        fields = dict(
+            node_id="node-1",
+            epoch=1,
+            step=10,
+            loss=0.5,
+            samples_processed=64,
+            time_taken_seconds=2.5,
+            samples_per_second=25.6,
+        )
+        metrics = TrainingMetrics(**fields, timestamp=recorded)
+        assert metrics.timestamp == recorded
+        
+        # Dumps carry both fields and load back unchanged
+        assert TrainingMetrics.model_validate(metrics.model_dump()) == metrics
+        
+        aggregated = AggregatedMetrics(
+            epoch=1,
+            session_id="session-1",
+            average_loss=0.5,
+            best_loss=0.4,
+            total_samples_processed=128,
+            average_throughput=25.6,
+            total_time_seconds=5.0,
+            num_nodes_participated=2,
+            timestamp=recorded,
+        )
+        assert aggregated.timestamp == recorded
+
+
+class TestMetricsHistory:
+    """Test MetricsHistory model."""
+    
+    def _metric(self, node_id: str, epoch: int) -> TrainingMetrics:
+        return TrainingMetrics(
+            node_id=node_id,
+            epoch=epoch,
+            step=0,
+            loss=0.5,
+            samples_processed=64,
+            time_taken_seconds=1.0,
+            samples_per_second=64.0,
+        )
+    
+    def test_indexed_lookups(self):
+        """Test node and epoch lookups return metrics in insertion order."""
+        history = MetricsHistory(training_metrics=[self._metric("node-1", 0)])
+        history.add_training_metric(self._metric("node-2", 0))
+        history.add_training_metric(self._metric("node-1", 1))
+        
+        node_1 = history.get_metrics_for_node("node-1")
+        assert [m.epoch for m in node_1] == [0, 1]
+        assert [m.node_id for m in history.get_metrics_for_epoch(0)] == ["node-1", "node-2"]
+        assert history.get_metrics_for_node("node-3") == []
+        assert history.get_metrics_for_epoch(5) == []
+    
+    def test_add_training_metrics_batch(self):
+        """Test batch ingestion validates columns and indexes records."""
+        records = [
+            {
+                "node_id": f"node-{i % 2}",
+                "epoch": i // 2,
+                "step": i,
+                "loss": 0.5,
+                "accuracy": 0.9,
+                "samples_processed": 64,
+                "time_taken_seconds": 1.0,
+                "samples_per_second": 64.0,
+            }
+            for i in range(4)
+        ]
+        history = MetricsHistory()
+        history.add_training_metrics_batch(records)
+        
+        assert len(history.training_metrics) == 4
+        assert [m.step for m in history.get_metrics_for_node("node-1")] == [1, 3]
+        assert isinstance(history.training_metrics[0].timestamp, datetime)
+        
+        with pytest.raises(ValidationError):
+            history.add_training_metrics_batch([records[0], dict(records[1], accuracy=1.5)])
+        with pytest.raises(ValidationError):
+            history.add_training_metrics_batch([dict(records[0], node_id=1)])
+        assert len(history.training_metrics) == 4
+        
+        # Same coercion and rules as building a single TrainingMetrics
+        record = dict(records[0], epoch="7", loss=float("nan"))
+        history.add_training_metrics_batch([record])
+        assert history.training_metrics[-1].epoch == TrainingMetrics(**record).epoch == 7
+        assert history.get_metrics_for_epoch(7) == [history.training_metrics[-1]]
 
 
 class TestNetworkMetrics:
@@ -271,6 +552,24 @@ class TestNetworkMetrics:
         assert score < 0.65  # Calculated score is ~0.62 for poor network
 
 
+    def test_vectorized_quality_scores(self):
+        """Test vectorized scores match the per-instance calculation."""
+        samples = [(50.0, 0.01, 100, 5), (0.0, 0.0, 0, 0), (1500.0, 0.2, 10, 10)]
+        expected = [
+            NetworkMetrics(
+                node_id="node-1",
+                latency_ms=latency,
+                packet_loss_rate=loss,
+                messages_sent=sent,
+                messages_failed=failed,
+            ).calculate_quality_score()
+            for latency, loss, sent, failed in samples
+        ]
+        
+        scores = calculate_quality_scores(*(np.array(col) for col in zip(*samples)))
+        assert np.allclose(scores, expected)
+
+
 class TestGradientUpdate:
     """Test GradientUpdate model."""
     
@@ -294,13 +593,205 @@ class TestGradientUpdate:
         assert update.gradient_norm == 5.5
         assert len(update.gradient_data) == 1
 
+    def test_validate_gradient_data(self):
+        """Test non-finite gradients are rejected."""
+        kwargs = dict(
+            node_id="node-1",
+            update_id="update-1",
+            epoch=1,
+            step=10,
+            batch_size=64,
+            gradient_shapes=[[2, 2], [3]],
+            gradient_norm=5.5,
+            num_parameters=7,
+            local_loss=0.5,
+            compute_time_seconds=2.0,
+        )
+
+        update = GradientUpdate(gradient_data=[[1.0, 2.0, 3.0, 4.0], [0.5, 0.5, 0.5]], **kwargs)
+        assert update.validate_gradient_data()
+
+        update = GradientUpdate(gradient_data=[[1.0, 2.0, 3.0, 4.0], [0.5, float("nan"), 0.5]], **kwargs)
+        assert not update.validate_gradient_data()
+
+        update = GradientUpdate(gradient_data=[[float("inf"), 2.0, 3.0, 4.0], [0.5, 0.5, 0.5]], **kwargs)
+        assert not update.validate_gradient_data()
+
+        update = GradientUpdate(gradient_data=[[1.0, 2.0, 3.0, 4.0], [0.5, 0.5]], **kwargs)
+        assert not update.validate_gradient_data()
+
+    def test_validate_gradient_reports_position(self):
+        """Test validate_gradient locates the first non-finite element."""
+        update = GradientUpdate(
+            node_id="node-1",
+            update_id="update-1",
+            epoch=1,
+            step=10,
+            batch_size=64,
+            gradient_data=[[1.0, 2.0, 3.0], [1.0, 2.0, 3.0, float("nan"), 5.0, 6.0]],
+            gradient_shapes=[[3], [2, 3]],
+            gradient_norm=5.5,
+            num_parameters=9,
+            local_loss=0.5,
+            compute_time_seconds=2.0,
+        )
+
+        is_valid, errors = validate_gradient(update)
+        assert not is_valid
+        assert errors == ["Invalid value (NaN/Inf) in gradient tensor 1 at position [1,0]"]
+
+    def test_gradient_buffer(self):
+        """Test tensors share one contiguous float32 buffer."""
+        update = GradientUpdate(
+            node_id="node-1",
+            update_id="update-1",
+            epoch=1,
+            step=10,
+            batch_size=64,
+            gradient_data=[[1.0, 2.0, 3.0, 4.0], [5.0, 6.0]],
+            gradient_shapes=[[2, 2], [2]],
+            gradient_norm=5.5,
+            num_parameters=6,
+            local_loss=0.5,
+            compute_time_seconds=2.0,
+        )
+
+        assert update.gradient_buffer.dtype == np.float32
+        assert update.gradient_buffer.tolist() == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+        assert all(t.base is update.gradient_buffer for t in update.gradient_data)
+        assert update.num_elements == 6
+        assert update.get_data_size_mb() == 6 * 4 / (1024 * 1024)
+
+        restored = GradientUpdate.model_validate_json(update.model_dump_json())
+        assert restored.gradient_buffer.tolist() == update.gradient_buffer.tolist()
+
+    @pytest.mark.parametrize("dtype", ["float32", "float16"])
+    def test_from_bytes_round_trip(self, dtype):
+        """Test an update built from a raw blob splits it by shape and gives it back."""
+        values = np.arange(7, dtype=dtype)
+        update = GradientUpdate.from_bytes(
+            values.tobytes(),
+            gradient_shapes=[[2, 2], [3]],
+            gradient_dtype=dtype,
+            node_id="node-1",
+            update_id="update-1",
+            epoch=1,
+            step=10,
+            batch_size=64,
+            gradient_norm=5.5,
+            num_parameters=7,
+            local_loss=0.5,
+            compute_time_seconds=2.0,
+        )
+        
+        assert [t.tolist() for t in update.gradient_data] == [[0, 1, 2, 3], [4, 5, 6]]
+        assert update.gradient_buffer.dtype == np.dtype(dtype)
+        assert update.validate_gradient_data()
+        assert update.to_bytes() == values.tobytes()
+    
+    @pytest.mark.parametrize("num_values", [6, 8])
+    def test_from_bytes_size_mismatch(self, num_values):
+        """Test a buffer that does not match the shapes is rejected."""
+        with pytest.raises(ValueError, match="gradient_shapes"):
+            GradientUpdate.from_bytes(
+                np.arange(num_values, dtype=np.float32).tobytes(),
+                gradient_shapes=[[2, 2], [3]],
+                node_id="node-1",
+                update_id="update-1",
+                epoch=1,
+                step=10,
+                batch_size=64,
+                gradient_norm=5.5,
+                num_parameters=7,
+                local_loss=0.5,
+                compute_time_seconds=2.0,
+            )
+    
+    def test_buffer_protocol_tensors(self):
+        """Test array.array and memoryview tensors are accepted."""
+        update = GradientUpdate(
+            node_id="node-1",
+            update_id="update-1",
+            epoch=1,
+            step=10,
+            batch_size=64,
+            gradient_data=[array.array("f", [1.0, 2.0, 3.0, 4.0]), memoryview(array.array("f", [5.0, 6.0]))],
+            gradient_shapes=[[2, 2], [2]],
+            gradient_norm=5.5,
+            num_parameters=6,
+            local_loss=0.5,
+            compute_time_seconds=2.0,
+        )
+        
+        assert update.gradient_buffer.tolist() == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+        assert update.validate_gradient_data()
+    
+    def test_quantize(self):
+        """Test int8 and float16 quantization round trips."""
+        update = GradientUpdate(
+            node_id="node-1",
+            update_id="update-1",
+            epoch=1,
+            step=10,
+            batch_size=64,
+            gradient_data=[[1.0, -2.0, 3.0, 4.0], [0.5, 0.25]],
+            gradient_shapes=[[2, 2], [2]],
+            gradient_norm=5.5,
+            num_parameters=6,
+            local_loss=0.5,
+            compute_time_seconds=2.0,
+        )
+        
+        int8 = update.quantize("int8")
+        assert int8.gradient_buffer.dtype == np.int8
+        assert int8.compression_ratio == 4.0
+        assert int8.get_data_size_mb() == 6 / (1024 * 1024)
+        assert int8.validate_gradient_data()
+        assert update.gradient_dtype == "float32"
+        
+        restored = GradientUpdate.model_validate_json(int8.model_dump_json())
+        for original, tensor in zip(update.gradient_data, restored.dequantize()):
+            assert np.allclose(original, tensor, atol=0.02)
+        
+        half = update.quantize("float16")
+        assert half.gradient_buffer.dtype == np.float16
+        assert half.compression_ratio == 2.0
+        for original, tensor in zip(update.gradient_data, half.dequantize()):
+            assert np.array_equal(original, tensor)
+    
+    def test_compile_validator(self):
+        """Test shape-specialized validators are cached and check size."""
+        validator = GradientUpdate.compile_validator([[2, 2], [3]])
+        assert validator is GradientUpdate.compile_validator([[2, 2], [3]])
+        
+        assert validator(np.zeros(7, dtype=np.float32))
+        assert not validator(np.zeros(6, dtype=np.float32))
+        assert not validator(np.array([0, 0, 0, 0, 0, 0, np.inf], dtype=np.float32))
+    
+    def test_all_finite_chunked(self):
+        """Test the chunked finite check on buffers larger than one chunk."""
+        buffer = np.zeros(_FINITE_CHECK_CHUNK * 2 + 3, dtype=np.float32)
+        assert _all_finite(buffer)
+
+        buffer[-1] = np.nan
+        assert not _all_finite(buffer)
+
+
+def derive_contribution(template: BlockchainContribution, **changes) -> BlockchainContribution:
+    """Copy a validated contribution with some fields changed, without re-validating it."""
+    contribution = copy.copy(template)
+    for name, value in changes.items():
+        setattr(contribution, name, value)
+    return contribution
+
 
 class TestBlockchainContribution:
     """Test BlockchainContribution model."""
     
-    def test_contribution_score_calculation(self):
-        """Test contribution score calculation."""
-        contribution = BlockchainContribution(
+    @pytest.fixture(scope="class")
+    def base_contribution(self) -> BlockchainContribution:
+        """Validated contribution template; derive per-test copies from it."""
+        return BlockchainContribution(
             node_id="node-1",
             wallet_address="0x123",
             session_id="session-1",
@@ -313,30 +804,97 @@ class TestBlockchainContribution:
             gradient_quality_score=0.9,
             network_reliability_score=0.95,
         )
+    
+    def test_contribution_score_calculation(self, base_contribution):
+        """Test contribution score calculation."""
+        contribution = derive_contribution(base_contribution)
         
         score = contribution.calculate_contribution_score()
         assert score > 0
         assert contribution.contribution_score == score
     
-    def test_contribution_with_rejections(self):
+    def test_contribution_with_rejections(self, base_contribution):
         """Test contribution score with some rejections."""
+        contribution = derive_contribution(
+            base_contribution,
+            gradients_accepted=8,
+            gradients_rejected=2,  # 20% rejection rate
+        )
+        
+        score = contribution.calculate_contribution_score()
+        # Should be lower due to rejections
+        assert score < 100.0 * 0.9 * 0.95  # Max if no rejections
+    
+    def test_contribution_score_defaults(self):
+        """Test score equals compute time with default quality and no rejections."""
         contribution = BlockchainContribution(
             node_id="node-1",
             wallet_address="0x123",
             session_id="session-1",
             epoch=1,
-            compute_time_seconds=100.0,
-            gradients_accepted=8,
-            gradients_rejected=2,  # 20% rejection rate
+            compute_time_seconds=42.5,
+            gradients_accepted=0,
             samples_processed=640,
             average_loss=0.5,
-            gradient_quality_score=0.9,
-            network_reliability_score=0.95,
         )
         
-        score = contribution.calculate_contribution_score()
-        # Should be lower due to rejections
-        assert score < 100.0 * 0.9 * 0.95  # Max if no rejections
+        assert contribution.calculate_contribution_score() == 42.5
+        assert contribution.contribution_score == 42.5
+    
+    def test_bulk_json_load(self):
+        """Test decoding a JSON array of contributions."""
+        raw = json.dumps([
+            {
+                "node_id": f"node-{i}",
+                "wallet_address": f"0x{i}",
+                "session_id": "session-1",
+                "epoch": i,
+                "compute_time_seconds": 10.0,
+                "gradients_accepted": 5,
+                "samples_processed": 320,
+                "average_loss": 0.5,
+            }
+            for i in range(3)
+        ]).encode()
+        
+        contributions = load_contributions_json(raw)
+        assert [c.node_id for c in contributions] == ["node-0", "node-1", "node-2"]
+        assert all(isinstance(c, BlockchainContribution) for c in contributions)
+        
+        with pytest.raises(ValueError):
+            load_contributions_json(b'[{"node_id": "node-0", "epoch": -1}]')
+    
+    def test_timestamp_serialization(self):
+        """Test nanosecond timestamp is exposed as a UTC datetime."""
+        contribution = BlockchainContribution(
+            node_id="node-1",
+            wallet_address="0x123",
+            session_id="session-1",
+            epoch=1,
+            compute_time_seconds=10.0,
+            gradients_accepted=1,
+            samples_processed=64,
+            average_loss=0.5,
+            timestamp_ns=1_700_000_000_000_000_000,
+        )
+        
+        assert contribution.timestamp == datetime(2023, 11, 14, 22, 13, 20, tzinfo=timezone.utc)
+        data = contribution.to_dict()
+        assert data["timestamp_ns"] == 1_700_000_000_000_000_000
+        assert data["timestamp"] == contribution.timestamp
+    
+    def test_dump_validate_round_trip(self, base_contribution):
+        """Test a dumped contribution, computed timestamp included, loads back."""
+        contribution = derive_contribution(base_contribution)
+        
+        assert BlockchainContribution(**contribution.to_dict()) == contribution
+        assert load_contributions_json(to_json([contribution])) == [contribution]
+        
+        # A timestamp on its own is stored as nanoseconds
+        data = contribution.to_dict()
+        del data["timestamp_ns"]
+        data["timestamp"] = "2023-11-14T22:13:20Z"
+        assert BlockchainContribution(**data).timestamp_ns == 1_700_000_000_000_000_000
 
 
 class TestSessionContributions:
@@ -403,6 +961,217 @@ class TestSessionContributions:
         
         # Check that node-1 gets more (higher compute time)
         assert distribution["node-1"] > distribution["node-0"]
+    
+    def test_equal_reward_distribution(self):
+        """Test rewards are split equally when no contribution has a score."""
+        session = SessionContributions(session_id="session-1")
+        
+        for i in range(4):
+            session.add_contribution(BlockchainContribution(
+                node_id=f"node-{i}",
+                wallet_address=f"0x{i}",
+                session_id="session-1",
+                epoch=1,
+                compute_time_seconds=0.0,
+                gradients_accepted=1,
+                samples_processed=64,
+                average_loss=0.5,
+            ))
+        
+        distribution = session.calculate_reward_distribution(100.0)
+        assert distribution == {f"node-{i}": 25.0 for i in range(4)}
+    
+    def test_register_nodes(self):
+        """Test pre-registered nodes start empty and receive contributions."""
+        session = SessionContributions(session_id="session-1", total_epochs=10)
+        session.register_nodes(["node-0", "node-1"])
+        
+        assert session.get_all_nodes() == ["node-0", "node-1"]
+        assert session.get_node_contributions("node-0") == []
+        
+        contribution = BlockchainContribution(
+            node_id="node-1",
+            wallet_address="0x1",
+            session_id="session-1",
+            epoch=0,
+            compute_time_seconds=10.0,
+            gradients_accepted=1,
+            samples_processed=64,
+            average_loss=0.5,
+        )
+        contribution.calculate_contribution_score()
+        session.add_contribution(contribution)
+        
+        distribution = session.calculate_reward_distribution(100.0)
+        assert distribution == {"node-0": 0.0, "node-1": 100.0}
+    
+    def test_running_score_totals(self):
+        """Test per-node and session score totals track added contributions."""
+        session = SessionContributions(session_id="session-1")
+        
+        for epoch in range(3):
+            contribution = BlockchainContribution(
+                node_id="node-1",
+                wallet_address="0x123",
+                session_id="session-1",
+                epoch=epoch,
+                compute_time_seconds=10.0,
+                gradients_accepted=5,
+                samples_processed=320,
+                average_loss=0.5,
+            )
+            contribution.calculate_contribution_score()
+            session.add_contribution(contribution)
+        
+        assert session.get_total_contribution_score("node-1") == pytest.approx(30.0)
+        assert session.get_total_contribution_score("node-2") == 0.0
+        assert session.calculate_reward_distribution(100.0) == {"node-1": pytest.approx(100.0)}
+    
+    def test_unscored_contribution_scored_on_add(self):
+        """Test contributions added without a score are scored when added."""
+        session = SessionContributions(session_id="session-1")
+        contributions = [
+            BlockchainContribution(
+                node_id=f"node-{i}",
+                wallet_address=f"0x{i}",
+                session_id="session-1",
+                epoch=0,
+                compute_time_seconds=10.0 * (i + 1),
+                gradients_accepted=1,
+                samples_processed=64,
+                average_loss=0.5,
+            )
+            for i in range(2)
+        ]
+        for contribution in contributions:
+            session.add_contribution(contribution)
+        
+        assert [c.contribution_score for c in contributions] == [10.0, 20.0]
+        assert session.get_total_contribution_score("node-1") == 20.0
+        assert session.get_total_contribution_score("node-2") == 0.0
+        distribution = session.calculate_reward_distribution(90.0)
+        assert distribution == {"node-0": pytest.approx(30.0), "node-1": pytest.approx(60.0)}
+    
+    def test_columnar_store(self):
+        """Test the columnar store scores and distributes like the record path."""
+        session = SessionContributions(session_id="session-1")
+        
+        for i in range(100):
+            contribution = BlockchainContribution(
+                node_id=f"node-{i % 3}",
+                wallet_address=f"0x{i % 3}",
+                session_id="session-1",
+                epoch=i,
+                compute_time_seconds=float(i + 1),
+                gradients_accepted=i % 5,
+                gradients_rejected=i % 2,
+                samples_processed=64,
+                average_loss=0.5,
+                gradient_quality_score=0.9,
+            )
+            contribution.calculate_contribution_score()
+            session.add_contribution(contribution)
+        
+        store = session.store
+        assert len(store) == 100
+        assert store.node_ids == ["node-0", "node-1", "node-2"]
+        
+        expected_scores = [
+            c.contribution_score
+            for node_id in store.node_ids
+            for c in session.get_node_contributions(node_id)
+        ]
+        assert sorted(store.calculate_contribution_scores().tolist()) == pytest.approx(sorted(expected_scores))
+        
+        expected = session.calculate_reward_distribution(1000.0)
+        distribution = store.calculate_reward_distribution(1000.0)
+        assert distribution == pytest.approx(expected)
+        
+        records = store.calculate_reward_distribution_array(1000.0)
+        assert records.node_id.tolist() == store.node_ids
+        assert records.reward.sum() == pytest.approx(1000.0)
+        assert records.reward.tolist() == pytest.approx([expected[n] for n in store.node_ids])
+    
+    def test_dump_validate_round_trip(self):
+        """Test a dumped session validates back with the same contributions."""
+        session = SessionContributions(session_id="session-1")
+        for i in range(3):
+            contribution = BlockchainContribution(
+                node_id=f"node-{i % 2}",
+                wallet_address=f"0x{i % 2}",
+                session_id="session-1",
+                epoch=i,
+                compute_time_seconds=10.0 * (i + 1),
+                gradients_accepted=1,
+                samples_processed=64,
+                average_loss=0.5,
+            )
+            contribution.calculate_contribution_score()
+            session.add_contribution(contribution)
+        
+        restored = SessionContributions.model_validate_json(session.model_dump_json())
+        assert restored.contributions == session.contributions
+        assert restored.start_time_ns == session.start_time_ns
+        assert restored.calculate_reward_distribution(60.0) == session.calculate_reward_distribution(60.0)
+    
+    def test_reward_shares_keep_full_precision(self):
+        """Test reward amounts match exact float64 arithmetic on the scores."""
+        session = SessionContributions(session_id="session-1")
+        for i, compute_time in enumerate([10.1, 100.3]):
+            session.add_contribution(BlockchainContribution(
+                node_id=f"node-{i}",
+                wallet_address=f"0x{i}",
+                session_id="session-1",
+                epoch=0,
+                compute_time_seconds=compute_time,
+                gradients_accepted=1,
+                samples_processed=64,
+                average_loss=0.5,
+            ))
+        
+        distribution = session.calculate_reward_distribution(100.0)
+        total = 10.1 + 100.3
+        assert distribution == {"node-0": 10.1 / total * 100.0, "node-1": 100.3 / total * 100.0}
+    
+    def test_columnar_store_large_counters(self):
+        """Test counters beyond 2**31 are stored without overflow."""
+        session = SessionContributions(session_id="session-1")
+        session.add_contribution(BlockchainContribution(
+            node_id="node-1",
+            wallet_address="0x1",
+            session_id="session-1",
+            epoch=0,
+            compute_time_seconds=10.0,
+            gradients_accepted=1,
+            samples_processed=3_000_000_000,
+            average_loss=0.5,
+        ))
+        
+        assert session.store.column("samples_processed").tolist() == [3_000_000_000]
+
+
+
+class TestRewardDistribution:
+    """Test RewardDistribution model."""
+    
+    def test_mark_distributed(self):
+        """Test distribution completes once every node has a transaction."""
+        distribution = RewardDistribution(
+            session_id="session-1",
+            total_reward_pool=100.0,
+            rewards={"node-0": 40.0, "node-1": 30.0, "node-2": 30.0},
+        )
+        
+        distribution.mark_distributed("node-0", "0xaaa")
+        assert not distribution.distributed
+        
+        # Re-marking a node does not count twice
+        distribution.mark_distributed("node-0", "0xaab")
+        assert not distribution.distributed
+        
+        distribution.mark_distributed_many([("node-1", "0xbbb"), ("node-2", "0xccc")])
+        assert distribution.distributed
+        assert distribution.transaction_hashes["node-2"] == "0xccc"
 
 
 if __name__ == "__main__":
@@ -212,8 +212,8 @@ class TestPerformanceBenchmarks:
         node_counts = [10, 20, 50, 100]
         results = []
         
-        for num_nodes in node_counts:
-            logger.info(f"\n[Test {node_counts.index(num_nodes) + 1}/4] Testing with {num_nodes} nodes...")
+        for test_num, num_nodes in enumerate(node_counts, start=1):
+            logger.info(f"\n[Test {test_num}/{len(node_counts)}] Testing with {num_nodes} nodes...")
             
             coordinator = TrainingCoordinator(test_config)
             coordinator.initialize_training()
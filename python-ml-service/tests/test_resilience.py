@@ -73,7 +73,7 @@ class TestNetworkResilience:
         # Step 1: Start training
         logger.info("[Step 1/5] Starting training with 5 nodes...")
         coordinator.is_training = True
-        initial_nodes = len(coordinator.node_registry.nodes)
+        initial_nodes = coordinator.node_registry.count_nodes()
         assert initial_nodes == 5
         logger.info(f"✓ Training started with {initial_nodes} nodes")
         
@@ -0,0 +1,334 @@
+"""
+Test tensor serialization utilities.
+"""
+
+import json
+import msgpack
+import numpy as np
+import pytest
+import torch
+from src.utils.serialization import (
+    serialize_tensors,
+    deserialize_tensors,
+    compress_gradients,
+    decompress_gradients,
+    serialize_sparse_tensors,
+    deserialize_sparse_tensors,
+    save_state_dict_flat,
+    tensor_to_json_compatible,
+    json_compatible_to_tensor,
+    load_state_dict_flat,
+    pack_tensor_frame,
+    unpack_tensor_frame,
+    _FRAME_ALIGNMENT,
+    _FRAME_DESCRIPTOR,
+    _FRAME_HEADER,
+)
+
+
+class TestTensorSerialization:
+    """Test serialize_tensors / deserialize_tensors."""
+
+    @pytest.fixture
+    def tensors(self):
+        return [
+            torch.randn(3, 4),
+            torch.arange(6, dtype=torch.int64).reshape(2, 3),
+            torch.tensor(5.0),
+            torch.randn(4, 3).t(),  # non-contiguous
+        ]
+
+    @pytest.mark.parametrize("use_msgpack", [False, True])
+    def test_round_trip(self, tensors, use_msgpack):
+        """Test tensors survive a round trip with shape and dtype."""
+        restored = deserialize_tensors(serialize_tensors(tensors, use_msgpack=use_msgpack))
+
+        assert len(restored) == len(tensors)
+        for original, tensor in zip(tensors, restored):
+            assert tensor.dtype == original.dtype
+            assert torch.equal(tensor, original)
+
+    def test_compressed_round_trip(self):
+        """Test compressed MessagePack payloads round trip and shrink sparse data."""
+        tensors = [torch.zeros(1000), torch.randn(3, 4)]
+        plain = serialize_tensors(tensors, use_msgpack=True)
+        packed = serialize_tensors(tensors, use_msgpack=True, compress=True)
+
+        assert packed["format"] in ("msgpack+zstd", "msgpack+zlib")
+        assert len(packed["binary"]) < len(plain["binary"])
+        restored = deserialize_tensors(packed)
+        assert all(torch.equal(a, b) for a, b in zip(restored, tensors))
+
+    @pytest.mark.parametrize("transport_dtype", [torch.float16, torch.bfloat16])
+    def test_transport_dtype_round_trip(self, transport_dtype):
+        """Test tensors travel downcast and come back in their original dtype."""
+        tensors = [torch.randn(3, 4), torch.arange(5)]
+        serialized = serialize_tensors(tensors, transport_dtype=transport_dtype)
+        plain = serialize_tensors(tensors)
+        assert len(serialized["data"][0]) < len(plain["data"][0])
+        assert serialized["data"][1] == plain["data"][1]
+
+        restored = deserialize_tensors(serialized)
+        assert restored[0].dtype == torch.float32
+        assert torch.allclose(restored[0], tensors[0], rtol=1e-2, atol=1e-2)
+        assert torch.equal(restored[1], tensors[1])
+
+    def test_bfloat16_tensor_round_trip(self):
+        """Test bfloat16 tensors serialize despite having no numpy dtype."""
+        tensor = torch.randn(4, 3).t().bfloat16()
+        restored = deserialize_tensors(serialize_tensors([tensor]))
+        assert restored[0].dtype == torch.bfloat16
+        assert torch.equal(restored[0], tensor)
+
+    def test_json_format_is_json_serializable(self, tensors):
+        """Test the JSON format can be encoded and decoded as JSON."""
+        serialized = json.loads(json.dumps(serialize_tensors(tensors)))
+        restored = deserialize_tensors(serialized)
+        assert torch.equal(restored[0], tensors[0])
+
+    def test_list_payload_still_supported(self):
+        """Test payloads that carry plain value lists still load."""
+        restored = deserialize_tensors({
+            "data": [[1.0, 2.0, 3.0, 4.0]],
+            "shapes": [[2, 2]],
+            "dtypes": ["float32"],
+        })
+        assert torch.equal(restored[0], torch.tensor([[1.0, 2.0], [3.0, 4.0]]))
+
+    @pytest.mark.parametrize("tensor", [
+        torch.randn(3, 4),
+        torch.arange(6).reshape(2, 3),
+        torch.tensor(1.5),
+        torch.randn(2, 2).bfloat16(),
+        torch.zeros(0, 3),
+    ])
+    def test_json_compatible_round_trip(self, tensor):
+        """Test single tensors survive a JSON round trip."""
+        encoded = json.loads(json.dumps(tensor_to_json_compatible(tensor)))
+        restored = json_compatible_to_tensor(encoded)
+        assert restored.dtype == tensor.dtype
+        assert torch.equal(restored, tensor)
+
+    def test_json_compatible_accepts_lists(self):
+        """Test nested lists still convert."""
+        restored = json_compatible_to_tensor([[1.0, 2.0], [3.0, 4.0]])
+        assert restored.tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+    @pytest.mark.parametrize("name", ["Tensor", "nn", "complex64", None])
+    def test_json_compatible_rejects_unknown_dtype(self, name):
+        """Test only dtypes from the dtype table are accepted."""
+        encoded = tensor_to_json_compatible(torch.zeros(2))
+        encoded["dtype"] = name
+        with pytest.raises(ValueError, match="Unsupported tensor dtype"):
+            json_compatible_to_tensor(encoded)
+
+
+class TestTensorFrame:
+    """Test the aligned binary tensor frame."""
+
+    @pytest.fixture
+    def tensors(self):
+        return [
+            torch.randn(3, 5),
+            torch.arange(7, dtype=torch.int64),
+            torch.tensor(2.5),
+            torch.tensor([True, False, True]),
+            torch.randn(4).half(),
+            torch.zeros(0),
+        ]
+
+    @pytest.mark.parametrize("as_bytes", [False, True])
+    def test_round_trip(self, tensors, as_bytes):
+        """Test tensors survive a frame round trip."""
+        frame = pack_tensor_frame(tensors)
+        restored = unpack_tensor_frame(bytes(frame) if as_bytes else frame)
+
+        for original, tensor in zip(tensors, restored):
+            assert tensor.dtype == original.dtype
+            assert tensor.shape == original.shape
+            assert torch.equal(tensor, original)
+
+    def test_bodies_are_aligned(self, tensors):
+        """Test every tensor body starts on an alignment boundary."""
+        frame = pack_tensor_frame(tensors)
+        position = _FRAME_HEADER.size
+        for _ in tensors:
+            _, ndim, body_offset = _FRAME_DESCRIPTOR.unpack_from(frame, position)
+            position += _FRAME_DESCRIPTOR.size + 8 * ndim
+            assert body_offset % _FRAME_ALIGNMENT == 0
+
+    def test_rejects_foreign_buffer(self):
+        """Test non-frame input is rejected."""
+        with pytest.raises(ValueError):
+            unpack_tensor_frame(b"\x00" * 32)
+
+
+class TestGradientCompression:
+    """Test compress_gradients."""
+
+    def test_topk_matches_exact_selection(self):
+        """Test topk returns the k largest-magnitude elements."""
+        gradients = [torch.randn(40, 25), torch.randn(3)]
+        compressed, metadata = compress_gradients(gradients, "topk", 0.01)
+
+        assert metadata["shapes"] == [[40, 25], [3]]
+        indices, values = compressed[0]
+        expected = torch.topk(gradients[0].flatten().abs(), 10).indices
+        assert set(indices.tolist()) == set(expected.tolist())
+        assert torch.equal(values, gradients[0].flatten()[indices])
+        assert len(compressed[1][0]) == 1
+
+    def test_topk_caps_ties_at_k(self):
+        """Test topk keeps exactly k elements when many tie at the threshold."""
+        gradient = torch.zeros(1000)
+        gradient[torch.arange(0, 1000, 50)] = torch.arange(1.0, 21.0)
+        compressed, _ = compress_gradients([gradient], "topk", 0.1)
+
+        indices, values = compressed[0]
+        assert len(indices) == 100
+        assert len(set(indices.tolist())) == 100
+        assert torch.count_nonzero(values) == 20
+        assert torch.equal(values, gradient[indices])
+
+    def test_gaussiank_keeps_about_k(self):
+        """Test gaussiank keeps roughly the requested fraction."""
+        torch.manual_seed(0)
+        gradient = torch.randn(100000)
+        compressed, _ = compress_gradients([gradient], "gaussiank", 0.01)
+
+        indices, values = compressed[0]
+        assert 800 < len(indices) < 1200
+        assert torch.equal(values, gradient[indices])
+
+    def test_error_feedback_carries_residual(self):
+        """Test dropped mass is kept and sent in later steps."""
+        gradient = torch.randn(200)
+        original = gradient.clone()
+        error_buffer = {}
+        total_sent = torch.zeros(200)
+
+        for step in range(1, 4):
+            compressed, _ = compress_gradients([gradient], "topk", 0.05, error_buffer)
+            indices, values = compressed[0]
+            total_sent[indices] += values
+            # Everything seen so far is either sent or still buffered
+            assert torch.allclose(total_sent + error_buffer[0], original * step, atol=1e-5)
+
+        assert torch.equal(gradient, original)
+
+    @pytest.mark.parametrize("dense", [True, False])
+    def test_sparse_serialization_round_trip(self, dense):
+        """Test top-k pairs ship as sparse buffers and restore in dense shape."""
+        gradients = [torch.randn(40, 25), torch.randn(7).double()]
+        compressed, metadata = compress_gradients(gradients, "topk", 0.05)
+        serialized = serialize_sparse_tensors(compressed, metadata["shapes"])
+
+        assert len(serialized["indices"]) == 4 * (50 + 1)
+        restored = deserialize_sparse_tensors(serialized, dense=dense)
+        for tensor, expected in zip(restored, decompress_gradients(compressed, metadata)):
+            if not dense:
+                assert tensor.is_sparse
+                tensor = tensor.to_dense()
+            assert tensor.dtype == expected.dtype
+            assert torch.equal(tensor, expected)
+
+    def test_sparse_bfloat16_round_trip(self):
+        """Test bfloat16 values travel as integer bytes and restore exactly."""
+        gradient = torch.randn(10, 10).bfloat16()
+        compressed, metadata = compress_gradients([gradient], "topk", 0.1)
+        serialized = msgpack.unpackb(msgpack.packb(
+            serialize_sparse_tensors(compressed, metadata["shapes"]), use_bin_type=True
+        ))
+
+        restored = deserialize_sparse_tensors(serialized)
+        assert restored[0].dtype == torch.bfloat16
+        assert torch.equal(restored[0], decompress_gradients(compressed, metadata)[0])
+
+    def test_sparse_named_dtypes_still_supported(self):
+        """Test older sparse payloads that name each dtype still load."""
+        restored = deserialize_sparse_tensors({
+            "indices": np.array([0, 3], dtype=np.int32).tobytes(),
+            "values": np.array([1.0, 2.0], dtype=np.float32).tobytes(),
+            "counts": [2],
+            "shapes": [[4]],
+            "dtypes": ["float32"],
+        })
+        assert torch.equal(restored[0], torch.tensor([1.0, 0.0, 0.0, 2.0]))
+
+    @pytest.mark.parametrize("bits", [8, 4])
+    def test_quantize_round_trip(self, bits):
+        """Test quantized gradients ship as bytes and dequantize within one step."""
+        gradients = [torch.randn(5, 7), torch.full((3,), 2.0)]
+        compressed, metadata = compress_gradients(gradients, "quantize", bits=bits)
+
+        assert isinstance(compressed[0]["data"], bytes)
+        assert len(compressed[0]["data"]) == 35 * bits // 8 + (35 * bits % 8 > 0)
+
+        restored = decompress_gradients(compressed, metadata)
+        for original, gradient, entry in zip(gradients, restored, compressed):
+            assert gradient.shape == original.shape
+            assert torch.allclose(gradient, original, atol=entry["scale"] / 2 + 1e-6)
+
+    def test_quantize_rejects_unknown_dtype(self):
+        """Test a quantized entry naming a non-dtype torch attribute is rejected."""
+        compressed, metadata = compress_gradients([torch.randn(4)], "quantize", bits=8)
+        compressed[0]["dtype"] = "Tensor"
+
+        with pytest.raises(ValueError):
+            decompress_gradients(compressed, metadata)
+
+    def test_topk_decompresses_to_dense(self):
+        """Test sparse pairs scatter back into the original shape."""
+        gradient = torch.randn(6, 4)
+        restored = decompress_gradients(*compress_gradients([gradient], "topk", 1.0))
+        assert torch.equal(restored[0], gradient)
+
+
+class TestFlatStateDict:
+    """Test flat state dict files."""
+
+    def test_round_trip(self, tmp_path):
+        """Test a saved state dict loads back into a fresh model."""
+        model = torch.nn.Sequential(torch.nn.Linear(5, 3), torch.nn.BatchNorm1d(3))
+        path = tmp_path / "model.bin"
+        save_state_dict_flat(model, str(path))
+
+        state_dict = load_state_dict_flat(str(path))
+        for name, tensor in model.state_dict().items():
+            assert state_dict[name].dtype == tensor.dtype
+            assert torch.equal(state_dict[name], tensor)
+
+        restored = torch.nn.Sequential(torch.nn.Linear(5, 3), torch.nn.BatchNorm1d(3))
+        restored.load_state_dict(state_dict)
+
+    def test_loaded_tensors_do_not_write_through(self, tmp_path):
+        """Test modifying a loaded tensor leaves the file unchanged."""
+        model = torch.nn.Linear(4, 2)
+        path = tmp_path / "model.bin"
+        save_state_dict_flat(model, str(path))
+        before = path.read_bytes()
+
+        load_state_dict_flat(str(path))["weight"].zero_()
+        assert path.read_bytes() == before
+
+    def test_truncated_file_rejected(self, tmp_path):
+        """Test a tensor extending past the end of the file is rejected."""
+        model = torch.nn.Linear(4, 2)
+        path = tmp_path / "model.bin"
+        save_state_dict_flat(model, str(path))
+        path.write_bytes(path.read_bytes()[:-4])
+
+        with pytest.raises(ValueError):
+            load_state_dict_flat(str(path))
+
+    def test_unknown_dtype_rejected(self, tmp_path):
+        """Test an index naming a non-dtype torch attribute is rejected."""
+        model = torch.nn.Linear(4, 2)
+        path = tmp_path / "model.bin"
+        save_state_dict_flat(model, str(path))
+        data = path.read_bytes()
+        path.write_bytes(data.replace(b'"float32"', b'"Tensor" ', 1))
+
+        with pytest.raises(ValueError):
+            load_state_dict_flat(str(path))
+